@@ -91,6 +91,9 @@ class DriftDetector:
         quality_model: str | None = None,
         quality_api_key: str | None = None,
         quality_sample_rate: float = 1.0,
+        quality_max_concurrent: int = 1,
+        quality_batch_size: int | None = None,
+        quality_use_cache: bool = False,
         verbose: bool = False,
         skip_basic_checks: bool = False,
     ) -> DriftReport:
@@ -107,6 +110,12 @@ class DriftDetector:
             quality_model: Model name override (defaults per backend).
             quality_api_key: API key for openai backend.
             quality_sample_rate: Fraction of APIs to check (0.0-1.0).
+            quality_max_concurrent: Max LLM requests in flight per module.
+            quality_batch_size: Send this many APIs per LLM call instead of
+                one call per API (None = per-API checks). Batched checks do
+                not use quality_max_concurrent or quality_use_cache.
+            quality_use_cache: Reuse LLM results cached under
+                root/.doc_checker_cache for unchanged docstrings.
             verbose: Print progress info.
             skip_basic_checks: Skip basic checks (for standalone link/quality runs).
 
@@ -136,6 +145,9 @@ class DriftDetector:
                 quality_model,
                 quality_api_key,
                 quality_sample_rate,
+                quality_max_concurrent,
+                quality_batch_size,
+                quality_use_cache,
                 verbose,
             )
         return report
@@ -468,6 +480,9 @@ class DriftDetector:
         model: str | None,
         api_key: str | None,
         sample_rate: float,
+        max_concurrent: int,
+        batch_size: int | None,
+        use_cache: bool,
         verbose: bool,
     ) -> None:
         """Evaluate docstring quality using LLM.
@@ -482,6 +497,9 @@ class DriftDetector:
             model: Model name override, or None for backend default.
             api_key: API key for openai backend (ignored for ollama).
             sample_rate: Fraction of APIs to check (0.0-1.0).
+            max_concurrent: Max LLM requests in flight per module.
+            batch_size: APIs per LLM call, or None for one call per API.
+            use_cache: Reuse cached per-API LLM results.
             verbose: Print progress (backend, model info).
         """
         try:
@@ -498,13 +516,24 @@ class DriftDetector:
                 model,
                 api_key,
                 ignore_submodules=self.ignore_submodules,
+                use_cache=use_cache,
             )
         except (ImportError, RuntimeError, ValueError) as e:
             report.warnings.append(f"Quality checks skipped: {e}")
             return
+        if batch_size and (use_cache or max_concurrent > 1):
+            report.warnings.append(
+                "Batched quality checks ignore the result cache and concurrency"
+            )
         if verbose:
             print(f"LLM quality checks ({backend}, {checker.backend.model})...")
         for module in self.modules:
-            report.quality_issues.extend(
-                checker.check_module_quality(module, verbose, sample_rate)
-            )
+            if batch_size is not None:
+                issues = checker.check_module_quality_batched(
+                    module, verbose, sample_rate, batch_size
+                )
+            else:
+                issues = checker.check_module_quality(
+                    module, verbose, sample_rate, max_concurrent
+                )
+            report.quality_issues.extend(issues)
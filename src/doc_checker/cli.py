@@ -12,8 +12,12 @@ from .checkers import DriftDetector
 from .formatters import format_report
 
 
-def main() -> int:
-    """Main CLI entry point."""
+def main(argv: list[str] | None = None) -> int:
+    """Main CLI entry point.
+
+    Args:
+        argv: Arguments to parse instead of ``sys.argv[1:]``.
+    """
     parser = argparse.ArgumentParser(
         description="Documentation drift detection for Python projects"
     )
@@ -52,6 +56,22 @@ def main() -> int:
         default=1.0,
         help="Sample rate for quality checks (0.0-1.0, default: 1.0 = all APIs)",
     )
+    parser.add_argument(
+        "--quality-concurrency",
+        type=int,
+        default=1,
+        help="Max concurrent LLM requests for quality checks (default: 1)",
+    )
+    parser.add_argument(
+        "--quality-batch-size",
+        type=int,
+        help="Check this many APIs per LLM call (default: one call per API)",
+    )
+    parser.add_argument(
+        "--quality-cache",
+        action="store_true",
+        help="Reuse LLM results for unchanged docstrings (.doc_checker_cache/)",
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument(
@@ -84,7 +104,18 @@ def main() -> int:
         help="Report issues but always exit 0 (non-blocking)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    # The batched path makes one call per chunk: no per-API cache or fan-out
+    if args.quality_batch_size is not None:
+        if args.quality_batch_size < 1:
+            parser.error("--quality-batch-size must be at least 1")
+        if args.quality_cache:
+            parser.error("--quality-cache cannot be combined with --quality-batch-size")
+        if args.quality_concurrency > 1:
+            parser.error(
+                "--quality-concurrency cannot be combined with --quality-batch-size"
+            )
 
     # Default to --check-all if nothing specified
     if not any(
@@ -131,6 +162,9 @@ def main() -> int:
             quality_model=args.llm_model,
             quality_api_key=api_key,
             quality_sample_rate=args.quality_sample,
+            quality_max_concurrent=args.quality_concurrency,
+            quality_batch_size=args.quality_batch_size,
+            quality_use_cache=args.quality_cache,
             verbose=args.verbose,
         )
 
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 from doc_checker.models import ExternalLink, LinkCheckResult
 
@@ -14,20 +15,45 @@ try:
 except ImportError:
     AIOHTTP_AVAILABLE = False
 
+try:
+    import urllib3
+
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
+
+# Keep-alive pool for the sync fallback; redirects followed, no retries
+_POOL: urllib3.PoolManager | None = (
+    urllib3.PoolManager(
+        num_pools=32, maxsize=8, retries=urllib3.Retry(connect=0, read=0, redirect=5)
+    )
+    if URLLIB3_AVAILABLE
+    else None
+)
+
 
 class LinkChecker:
     """Check external HTTP links."""
 
-    SKIP_DOMAINS = {"pasqalworkspace.slack.com", "cdn.jsdelivr.net"}
+    SKIP_DOMAINS = frozenset({"pasqalworkspace.slack.com", "cdn.jsdelivr.net"})
     ACCEPTABLE_STATUS = {403, 405, 429}  # Blocked but exists
+    HEAD_FALLBACK_STATUS = {405, 501}  # HEAD unsupported, retry with GET
     USER_AGENT = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
+    # Browser-like Accept too: some servers reject bare HEADs, forcing a GET
+    HEADERS = {
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+    }
 
-    def __init__(self, timeout: float = 10.0, max_concurrent: int = 5):
+    def __init__(
+        self, timeout: float = 10.0, max_concurrent: int = 5, max_per_host: int = 2
+    ):
         self.timeout = timeout
         self.max_concurrent = max_concurrent
+        self.max_per_host = max_per_host
 
     def check_links(
         self, links: list[ExternalLink], verbose: bool = False
@@ -40,22 +66,41 @@ class LinkChecker:
         return asyncio.run(self._check_async(links, verbose))
 
     async def _check_async(
-        self, links: list[ExternalLink], verbose: bool
+        self,
+        links: list[ExternalLink],
+        verbose: bool,
+        session: aiohttp.ClientSession | None = None,
     ) -> list[LinkCheckResult]:
-        """Async checking with aiohttp."""
-        unique = self._deduplicate(links)
-        filtered = [link for link in unique if not self._should_skip(link.url, verbose)]
+        """Async checking with aiohttp.
+
+        Uses `session` when given (the caller owns and closes it); otherwise
+        opens one session, with DNS results cached for the whole run and at
+        most `max_per_host` connections to any single host.
+        """
+        filtered = self._links_to_check(links, verbose)
 
         semaphore = asyncio.Semaphore(self.max_concurrent)
-        connector = aiohttp.TCPConnector(limit=self.max_concurrent)
+        if session is not None:
+            return await self._gather(session, filtered, semaphore, verbose)
 
-        async with aiohttp.ClientSession(
-            connector=connector, headers={"User-Agent": self.USER_AGENT}
-        ) as session:
-            tasks = [
-                self._check_one(session, link, semaphore, verbose) for link in filtered
-            ]
-            return await asyncio.gather(*tasks)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrent,
+            limit_per_host=self.max_per_host,
+            ttl_dns_cache=300,
+        )
+        async with aiohttp.ClientSession(connector=connector) as own_session:
+            return await self._gather(own_session, filtered, semaphore, verbose)
+
+    async def _gather(
+        self,
+        session: aiohttp.ClientSession,
+        links: list[ExternalLink],
+        semaphore: asyncio.Semaphore,
+        verbose: bool,
+    ) -> list[LinkCheckResult]:
+        """Check all links concurrently over one session."""
+        tasks = [self._check_one(session, link, semaphore, verbose) for link in links]
+        return list(await asyncio.gather(*tasks))
 
     async def _check_one(
         self,
@@ -69,32 +114,29 @@ class LinkChecker:
             if verbose:
                 print(f"  Checking {link.url}...")
             try:
-                # Try HEAD first
+                # Try HEAD first; the body is never read, even on the GET retry
+                timeout = aiohttp.ClientTimeout(total=self.timeout)
                 async with session.head(
                     link.url,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    headers=self.HEADERS,
+                    timeout=timeout,
                     allow_redirects=True,
                 ) as response:
                     status = response.status
-                    if status in self.ACCEPTABLE_STATUS:
-                        return LinkCheckResult(
-                            link=link, status_code=status, error=None, is_broken=False
-                        )
-                    if status == 405:  # Try GET
-                        async with session.get(
-                            link.url,
-                            timeout=aiohttp.ClientTimeout(total=self.timeout),
-                            allow_redirects=True,
-                        ) as get_resp:
-                            return LinkCheckResult(
-                                link=link,
-                                status_code=get_resp.status,
-                                error=None,
-                                is_broken=get_resp.status >= 400,
-                            )
-                    return LinkCheckResult(
-                        link=link, status_code=status, error=None, is_broken=status >= 400
-                    )
+                if status in self.HEAD_FALLBACK_STATUS:
+                    async with session.get(
+                        link.url,
+                        headers=self.HEADERS,
+                        timeout=timeout,
+                        allow_redirects=True,
+                    ) as get_resp:
+                        status = get_resp.status
+                return LinkCheckResult(
+                    link=link,
+                    status_code=status,
+                    error=None,
+                    is_broken=self._is_broken_status(status),
+                )
             except asyncio.TimeoutError:
                 return LinkCheckResult(
                     link=link, status_code=None, error="Timeout", is_broken=True
@@ -111,78 +153,127 @@ class LinkChecker:
     def _check_sync(
         self, links: list[ExternalLink], verbose: bool
     ) -> list[LinkCheckResult]:
-        """Fallback sync checking with urllib."""
-        import urllib.error
-        import urllib.request
+        """Fallback sync checking, up to max_concurrent links in parallel.
 
-        results: list[LinkCheckResult] = []
-        unique = self._deduplicate(links)
+        Blocking requests run in a thread pool; results keep link order.
+        """
+        to_check = self._links_to_check(links, verbose)
+        if not to_check:
+            return []
 
-        for link in unique:
-            if self._should_skip(link.url, verbose):
-                continue
-            if verbose:
+        if verbose:
+            for link in to_check:
                 print(f"  Checking {link.url}...")
 
+        workers = min(self.max_concurrent, len(to_check))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self._check_single_sync, to_check))
+
+    def _check_single_sync(self, link: ExternalLink) -> LinkCheckResult:
+        """Check single link with a blocking HEAD (GET if HEAD is unsupported).
+
+        Goes through the pooled urllib3 connections when urllib3 is installed,
+        otherwise opens a fresh urllib connection per link.
+        """
+        if _POOL is not None:
+            return self._check_single_pooled(_POOL, link)
+
+        import urllib.error
+
+        try:
             try:
-                req = urllib.request.Request(
-                    link.url, headers={"User-Agent": self.USER_AGENT}, method="HEAD"
-                )
-                with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                    status = response.getcode()
-                    results.append(
-                        LinkCheckResult(
-                            link=link,
-                            status_code=status,
-                            error=None,
-                            is_broken=status >= 400,
-                        )
-                    )
+                status = self._urlopen_status(link.url, "HEAD")
             except urllib.error.HTTPError as e:
-                if e.code in self.ACCEPTABLE_STATUS:
-                    results.append(
-                        LinkCheckResult(
-                            link=link, status_code=e.code, error=None, is_broken=False
-                        )
-                    )
-                else:
-                    results.append(
-                        LinkCheckResult(
-                            link=link,
-                            status_code=e.code,
-                            error=str(e.reason),
-                            is_broken=True,
-                        )
-                    )
-            except urllib.error.URLError as e:
-                results.append(
-                    LinkCheckResult(
-                        link=link, status_code=None, error=str(e.reason), is_broken=True
-                    )
+                if e.code not in self.HEAD_FALLBACK_STATUS:
+                    raise
+                status = self._urlopen_status(link.url, "GET")
+            return LinkCheckResult(
+                link=link, status_code=status, error=None, is_broken=status >= 400
+            )
+        except urllib.error.HTTPError as e:
+            if e.code in self.ACCEPTABLE_STATUS:
+                return LinkCheckResult(
+                    link=link, status_code=e.code, error=None, is_broken=False
                 )
-            except Exception as e:
-                results.append(
-                    LinkCheckResult(
-                        link=link, status_code=None, error=str(e), is_broken=True
-                    )
+            return LinkCheckResult(
+                link=link, status_code=e.code, error=str(e.reason), is_broken=True
+            )
+        except urllib.error.URLError as e:
+            return LinkCheckResult(
+                link=link, status_code=None, error=str(e.reason), is_broken=True
+            )
+        except Exception as e:
+            return LinkCheckResult(
+                link=link, status_code=None, error=str(e), is_broken=True
+            )
+
+    def _urlopen_status(self, url: str, method: str) -> int:
+        """Status of a urllib request; HTTP errors raise HTTPError."""
+        import urllib.request
+
+        req = urllib.request.Request(url, headers=self.HEADERS, method=method)
+        with urllib.request.urlopen(req, timeout=self.timeout) as response:
+            return int(response.getcode())
+
+    def _check_single_pooled(
+        self, pool: urllib3.PoolManager, link: ExternalLink
+    ) -> LinkCheckResult:
+        """Check single link over a urllib3 connection pool."""
+        headers = self.HEADERS
+        timeout = urllib3.Timeout(total=self.timeout)
+        try:
+            response = pool.request("HEAD", link.url, headers=headers, timeout=timeout)
+            if response.status in self.HEAD_FALLBACK_STATUS:
+                response = pool.request(
+                    "GET",
+                    link.url,
+                    headers=headers,
+                    timeout=timeout,
+                    preload_content=False,
                 )
+                # Body unread: drop the socket, then hand the slot back to the pool
+                response.close()
+                response.release_conn()
+        except Exception as e:
+            return LinkCheckResult(
+                link=link, status_code=None, error=str(e), is_broken=True
+            )
+        status = response.status
+        if not self._is_broken_status(status):
+            return LinkCheckResult(
+                link=link, status_code=status, error=None, is_broken=False
+            )
+        return LinkCheckResult(
+            link=link, status_code=status, error=response.reason, is_broken=True
+        )
+
+    def _is_broken_status(self, status: int) -> bool:
+        """HTTP error status that isn't in ACCEPTABLE_STATUS."""
+        return status >= 400 and status not in self.ACCEPTABLE_STATUS
 
-        return results
+    def _links_to_check(
+        self, links: list[ExternalLink], verbose: bool
+    ) -> list[ExternalLink]:
+        """First occurrence of each non-skip-listed URL, in order.
 
-    def _deduplicate(self, links: list[ExternalLink]) -> list[ExternalLink]:
-        """Keep first occurrence of each URL."""
+        One pass: repeated URLs are dropped by a set lookup before their
+        host is parsed, so each distinct URL goes through urlsplit once.
+        """
         seen: set[str] = set()
-        unique: list[ExternalLink] = []
+        to_check: list[ExternalLink] = []
         for link in links:
-            if link.url not in seen:
-                seen.add(link.url)
-                unique.append(link)
-        return unique
+            url = link.url
+            if url in seen:
+                continue
+            seen.add(url)
+            if not self._should_skip(url, verbose):
+                to_check.append(link)
+        return to_check
 
     def _should_skip(self, url: str, verbose: bool) -> bool:
         """Check if URL should be skipped."""
-        parsed = urlparse(url)
-        if parsed.netloc in self.SKIP_DOMAINS:
+        # hostname drops port/userinfo and lowercases, so this is one hash lookup
+        if urlsplit(url).hostname in self.SKIP_DOMAINS:
             if verbose:
                 print(f"  Skipping {url} (domain in skip list)")
             return True
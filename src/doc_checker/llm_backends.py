@@ -5,7 +5,16 @@ from __future__ import annotations
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
+
+# orjson (optional) parses LLM responses several times faster than json
+_json_loads: Callable[[str], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 class LLMBackend(ABC):
@@ -32,7 +41,8 @@ class LLMBackend(ABC):
             response = response[start:end].strip()
 
         try:
-            result: dict[str, Any] = json.loads(response)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            result: dict[str, Any] = _json_loads(response)
             return result
         except json.JSONDecodeError as e:
             # Fallback: return error structure
@@ -2,12 +2,39 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from itertools import repeat
 from pathlib import Path
+from typing import Any, Callable
 
 from .code_analyzer import CodeAnalyzer
 from .llm_backends import get_backend
-from .models import QualityIssue
-from .prompts import get_combined_quality_prompt
+from .models import QualityIssue, SignatureInfo
+from .prompts import get_batch_quality_prompt, get_combined_quality_prompt
+
+# orjson (optional) writes and reads cache entries as compact bytes directly
+_json_dumps: Callable[[Any], bytes]
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+CACHE_DIR_NAME = ".doc_checker_cache"
+SEVERITY_RANK = {"critical": 0, "warning": 1, "suggestion": 2}
 
 
 class QualityChecker:
@@ -20,6 +47,8 @@ class QualityChecker:
         model: str | None = None,
         api_key: str | None = None,
         ignore_submodules: set[str] | None = None,
+        use_cache: bool = False,
+        max_issues_per_api: int | None = 3,
     ):
         """Initialize quality checker.
 
@@ -29,6 +58,12 @@ class QualityChecker:
             model: Model name (uses defaults if None)
             api_key: API key for cloud backends
             ignore_submodules: Submodule names to skip.
+            use_cache: Reuse per-API results stored under
+                root_path/.doc_checker_cache, keyed on the prompt and model,
+                so unchanged docstrings skip the LLM call on re-runs.
+            max_issues_per_api: Keep only this many most severe issues per
+                API (also requested in the prompt, to cut output tokens);
+                None keeps all.
 
         Raises:
             ImportError: If backend package not installed
@@ -38,6 +73,8 @@ class QualityChecker:
         self.code_analyzer = CodeAnalyzer(root_path)
         self.backend = get_backend(backend_type, model, api_key)
         self.ignore_submodules = ignore_submodules
+        self.cache_dir = root_path / CACHE_DIR_NAME if use_cache else None
+        self.max_issues_per_api = max_issues_per_api
 
     def check_api_quality(
         self, api_name: str, module_name: str, verbose: bool = False
@@ -69,23 +106,9 @@ class QualityChecker:
             ]
 
         if not api_info.docstring:
-            return [
-                QualityIssue(
-                    api_name=f"{module_name}.{api_name}",
-                    severity="critical",
-                    category="completeness",
-                    message="No docstring found",
-                    suggestion="Add docstring explaining what this API does",
-                    line_reference=None,
-                )
-            ]
+            return [self._no_docstring_issue(f"{module_name}.{api_name}")]
 
-        # Build signature string
-        params_str = ", ".join(api_info.parameters)
-        return_str = (
-            f" -> {api_info.return_annotation}" if api_info.return_annotation else ""
-        )
-        signature = f"def {api_name}({params_str}){return_str}"
+        signature = self._signature(api_name, api_info)
 
         if verbose:
             print(f"  Checking {module_name}.{api_name}...")
@@ -95,43 +118,38 @@ class QualityChecker:
             signature=signature,
             docstring=api_info.docstring,
             api_name=f"{module_name}.{api_name}",
+            max_issues=self.max_issues_per_api,
         )
 
+        cache_file = self._cache_file(prompt)
+        cached = self._read_cache(cache_file)
+        if cached is not None:
+            return cached
+
         try:
             response = self.backend.generate_json(prompt)
         except Exception as e:
-            return [
-                QualityIssue(
-                    api_name=f"{module_name}.{api_name}",
-                    severity="warning",
-                    category="error",
-                    message=f"LLM check failed: {e}",
-                    suggestion="Check LLM backend connection",
-                    line_reference=None,
-                )
-            ]
+            return [self._llm_error_issue(f"{module_name}.{api_name}", e)]
 
-        # Parse response
-        issues = []
-        for issue_data in response.get("issues", []):
-            issues.append(
-                QualityIssue(
-                    api_name=f"{module_name}.{api_name}",
-                    severity=issue_data.get("severity", "warning"),
-                    category=issue_data.get("category", "unknown"),
-                    message=issue_data.get("message", "No message"),
-                    suggestion=issue_data.get("suggestion", "No suggestion"),
-                    line_reference=issue_data.get("line_reference"),
-                )
-            )
+        issues = self._parse_issues(
+            f"{module_name}.{api_name}", response.get("issues", [])
+        )
 
         if verbose and issues:
             print(f"    Found {len(issues)} issues (score: {response.get('score', 0)})")
 
+        # A parse failure yields no issues; caching it would hide the API for good
+        if "error" not in response:
+            self._write_cache(cache_file, issues)
+
         return issues
 
     def check_module_quality(
-        self, module_name: str, verbose: bool = False, sample_rate: float = 1.0
+        self,
+        module_name: str,
+        verbose: bool = False,
+        sample_rate: float = 1.0,
+        max_concurrent: int = 1,
     ) -> list[QualityIssue]:
         """Check quality of all APIs in a module.
 
@@ -139,10 +157,117 @@ class QualityChecker:
             module_name: Module to check (e.g., "emu_mps")
             verbose: Print progress
             sample_rate: Check only this fraction of APIs (0.0-1.0)
+            max_concurrent: Max LLM requests in flight; above 1 the per-API
+                checks run in worker threads so request latencies overlap
+
+        Returns:
+            List of all quality issues found, in API order
+        """
+        apis, no_apis = self._module_apis(module_name, verbose, sample_rate)
+        if no_apis:
+            return no_apis
+
+        if max_concurrent > 1:
+            workers = min(max_concurrent, len(apis))
+            names = [api.name for api in apis]
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(
+                    self.check_api_quality, names, repeat(module_name), repeat(verbose)
+                )
+                return [issue for issues in results for issue in issues]
+
+        all_issues = []
+        for api in apis:
+            issues = self.check_api_quality(api.name, module_name, verbose)
+            all_issues.extend(issues)
+
+        return all_issues
+
+    def check_module_quality_batched(
+        self,
+        module_name: str,
+        verbose: bool = False,
+        sample_rate: float = 1.0,
+        batch_size: int = 8,
+    ) -> list[QualityIssue]:
+        """Check quality of all APIs in a module, several APIs per LLM call.
+
+        Same result shape as check_module_quality, but documented APIs are
+        sent in chunks of `batch_size` via get_batch_quality_prompt, so the
+        per-call overhead (prompt prefill, request latency) is paid once per
+        chunk instead of once per API.
+
+        Args:
+            module_name: Module to check (e.g., "emu_mps")
+            verbose: Print progress
+            sample_rate: Check only this fraction of APIs (0.0-1.0)
+            batch_size: APIs per LLM call (at least 1)
 
         Returns:
-            List of all quality issues found
+            List of all quality issues found. Every API of a batch gets an
+            error-category warning if the call fails or its response is
+            unusable; APIs the response leaves out get one each.
+
+        Raises:
+            ValueError: If batch_size is below 1
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        apis, no_apis = self._module_apis(module_name, verbose, sample_rate)
+        if no_apis:
+            return no_apis
+
+        all_issues: list[QualityIssue] = []
+        documented: list[SignatureInfo] = []
+        for api in apis:
+            if api.docstring:
+                documented.append(api)
+                continue
+            all_issues.append(self._no_docstring_issue(f"{module_name}.{api.name}"))
+
+        for start in range(0, len(documented), batch_size):
+            batch = documented[start : start + batch_size]
+            names = [f"{module_name}.{api.name}" for api in batch]
+            if verbose:
+                print(f"  Checking {', '.join(names)}...")
+            prompt = get_batch_quality_prompt(
+                [
+                    (name, self._signature(api.name, api), api.docstring or "")
+                    for name, api in zip(names, batch)
+                ],
+                max_issues=self.max_issues_per_api,
+            )
+            try:
+                response = self.backend.generate_json(prompt)
+            except Exception as e:
+                all_issues.extend(self._llm_error_issue(name, e) for name in names)
+                continue
+            entries = response.get("apis")
+            if "error" in response or not isinstance(entries, list):
+                reason = response.get("error", 'response has no "apis" list')
+                all_issues.extend(self._llm_error_issue(name, reason) for name in names)
+                continue
+            # Index by the batch's own names; names the model invented are dropped
+            by_name: dict[str, dict[str, Any]] = {}
+            for entry in entries:
+                if isinstance(entry, dict) and entry.get("name") in names:
+                    by_name.setdefault(entry["name"], entry)
+            for name in names:
+                if name in by_name:
+                    all_issues.extend(
+                        self._parse_issues(name, by_name[name].get("issues", []))
+                    )
+                else:
+                    all_issues.append(
+                        self._llm_error_issue(name, "response has no entry for this API")
+                    )
+
+        return all_issues
+
+    def _module_apis(
+        self, module_name: str, verbose: bool, sample_rate: float
+    ) -> tuple[list[SignatureInfo], list[QualityIssue]]:
+        """Public APIs to check, sampled; or a single issue if there are none."""
         import random
 
         apis, _ = self.code_analyzer.get_all_public_apis(
@@ -152,7 +277,7 @@ class QualityChecker:
         if not apis:
             if verbose:
                 print(f"No public APIs found in {module_name}")
-            return [
+            return [], [
                 QualityIssue(
                     api_name=module_name,
                     severity="warning",
@@ -164,14 +289,111 @@ class QualityChecker:
             ]
 
         if sample_rate < 1.0:
-            apis = random.sample(apis, int(len(apis) * sample_rate))
+            # Sample indices, not items: one small draw, and the sorted indices
+            # keep the analyzer's API order in the report
+            k = max(1, int(len(apis) * sample_rate))
+            apis = [apis[i] for i in sorted(random.sample(range(len(apis)), k))]
 
         if verbose:
             print(f"Checking {len(apis)} APIs in {module_name}...")
 
-        all_issues = []
-        for api in apis:
-            issues = self.check_api_quality(api.name, module_name, verbose)
-            all_issues.extend(issues)
+        return apis, []
 
-        return all_issues
+    def _cache_file(self, prompt: str) -> Path | None:
+        """Cache entry for a prompt under the current model, if caching is on."""
+        if self.cache_dir is None:
+            return None
+        model = getattr(self.backend, "model", "")
+        key = hashlib.blake2b(f"{model}\0{prompt}".encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _no_docstring_issue(api_name: str) -> QualityIssue:
+        """Critical issue reported for an API without a docstring."""
+        return QualityIssue(
+            api_name=api_name,
+            severity="critical",
+            category="completeness",
+            message="No docstring found",
+            suggestion="Add docstring explaining what this API does",
+            line_reference=None,
+        )
+
+    @staticmethod
+    def _llm_error_issue(api_name: str, error: object) -> QualityIssue:
+        """Warning reported when the LLM call for an API fails or is unusable."""
+        return QualityIssue(
+            api_name=api_name,
+            severity="warning",
+            category="error",
+            message=f"LLM check failed: {error}",
+            suggestion="Check LLM backend connection",
+            line_reference=None,
+        )
+
+    @staticmethod
+    def _read_cache(cache_file: Path | None) -> list[QualityIssue] | None:
+        """Cached issues, or None on a miss or an unreadable/corrupt entry."""
+        if cache_file is None:
+            return None
+        try:
+            return [QualityIssue(**d) for d in _json_loads(cache_file.read_bytes())]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _write_cache(cache_file: Path | None, issues: list[QualityIssue]) -> None:
+        """Store issues atomically, so readers never see a partial entry.
+
+        Best effort: an unwritable cache dir just means no caching.
+        """
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps([asdict(issue) for issue in issues]))
+            os.replace(tmp_name, cache_file)
+        except BaseException as e:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            if not isinstance(e, OSError):
+                raise
+
+    @staticmethod
+    def _signature(api_name: str, api_info: SignatureInfo) -> str:
+        """Signature string shown to the LLM, e.g. "def f(x: int) -> bool"."""
+        params_str = ", ".join(api_info.parameters)
+        return_str = (
+            f" -> {api_info.return_annotation}" if api_info.return_annotation else ""
+        )
+        return f"def {api_name}({params_str}){return_str}"
+
+    def _parse_issues(
+        self, api_name: str, issues_data: list[dict[str, Any]]
+    ) -> list[QualityIssue]:
+        """Build QualityIssues from the "issues" list of an LLM response.
+
+        Keeps the max_issues_per_api most severe ones, in response order
+        within a severity.
+        """
+        if self.max_issues_per_api is not None:
+            issues_data = sorted(
+                issues_data,
+                key=lambda d: SEVERITY_RANK.get(d.get("severity", "warning"), 1),
+            )[: self.max_issues_per_api]
+        return [
+            QualityIssue(
+                api_name=api_name,
+                severity=issue_data.get("severity", "warning"),
+                category=issue_data.get("category", "unknown"),
+                message=issue_data.get("message", "No message"),
+                suggestion=issue_data.get("suggestion", "No suggestion"),
+                line_reference=issue_data.get("line_reference"),
+            )
+            for issue_data in issues_data
+        ]
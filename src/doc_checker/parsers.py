@@ -287,6 +287,8 @@ class YamlParser:
         """
         self.mkdocs_path = mkdocs_path
         self.docs_path = docs_path
+        self._nav_paths_cache: list[str] | None = None
+        self._nav_loaded = False
 
     def get_nav_files(self) -> set[str] | None:
         """Extract all file paths referenced in nav section.
@@ -294,10 +296,10 @@ class YamlParser:
         Returns:
             Set of file path strings from nav, or None if mkdocs.yml missing/no nav.
         """
-        nav = self._load_nav()
-        if nav is None:
+        nav_paths = self._nav_paths()
+        if nav_paths is None:
             return None
-        return set(self._collect_nav_paths(nav))
+        return set(nav_paths)
 
     def check_nav_paths(self) -> list[dict[str, str]]:
         """Validate all nav paths exist in docs directory.
@@ -306,16 +308,29 @@ class YamlParser:
             List of dicts with 'path' and 'location' keys for each broken path.
             Empty list if mkdocs.yml missing, no nav section, or all paths valid.
         """
-        nav = self._load_nav()
-        if nav is None:
+        nav_paths = self._nav_paths()
+        if nav_paths is None:
             return []
 
         broken = []
-        for path in self._collect_nav_paths(nav):
+        for path in nav_paths:
             if not (self.docs_path / path).exists():
                 broken.append({"path": path, "location": "mkdocs.yml"})
         return broken
 
+    def _nav_paths(self) -> list[str] | None:
+        """All nav file paths, parsed from mkdocs.yml once and cached.
+
+        Returns:
+            Nav paths in order, or None if mkdocs.yml missing/no nav/parse error.
+        """
+        if not self._nav_loaded:
+            nav = self._load_nav()
+            if nav is not None:
+                self._nav_paths_cache = self._collect_nav_paths(nav)
+            self._nav_loaded = True
+        return self._nav_paths_cache
+
     def _load_nav(self) -> list[Any] | None:
         """Load nav section from mkdocs.yml.
 
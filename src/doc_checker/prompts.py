@@ -5,6 +5,66 @@
 
 from __future__ import annotations
 
+# Checklist and severity guide shared by the single-API and batch quality prompts
+_QUALITY_CHECKS = """1. **English Quality**: grammar, spelling, clarity, style
+2. **Code Alignment**: docstring matches signature and implementation
+3. **Completeness**: all parameters, returns, exceptions documented
+4. **Technical Accuracy**: correct terminology, accurate descriptions
+
+CRITICAL: Use simple, clear language. Provide concrete before/after examples for every issue."""
+
+_SEVERITY_GUIDE = """Severity guide:
+- critical: Wrong info, missing required docs, major grammar errors
+- warning: Unclear phrasing, minor inconsistencies, missing nice-to-haves
+- suggestion: Style improvements, additional examples"""
+
+# Review instructions, output schema and examples shared by every combined
+# prompt; built once at import instead of re-rendered per API
+_COMBINED_QUALITY_FOOTER = f"""Check ALL of:
+{_QUALITY_CHECKS}
+
+Respond ONLY with valid JSON (no markdown):
+{{
+  "issues": [
+    {{
+      "severity": "critical|warning|suggestion",
+      "category": "grammar|clarity|style|params|returns|exceptions|completeness|accuracy",
+      "message": "Simple explanation anyone can understand",
+      "suggestion": "Specific fix with before/after example",
+      "line_reference": "exact problematic text or null"
+    }}
+  ],
+  "score": 0-100,
+  "summary": "One sentence overall assessment"
+}}
+
+Example issue formats:
+
+Grammar issue:
+{{
+  "message": "Missing article 'the' makes sentence unclear",
+  "suggestion": "Change 'Evolves state' to 'Evolves the state'",
+  "line_reference": "Evolves state"
+}}
+
+Missing parameter:
+{{
+  "message": "Parameter 'dt' is not documented",
+  "suggestion": "Add: 'dt (float): Time step in nanoseconds. Default: 10'",
+  "line_reference": null
+}}
+
+Incomplete description:
+{{
+  "message": "Doesn't explain what MPS truncation does",
+  "suggestion": "Add: 'Truncation removes small singular values to control memory, trading accuracy for performance'",
+  "line_reference": "Performs MPS truncation"
+}}
+
+{_SEVERITY_GUIDE}
+
+Score guide: 90-100 excellent, 70-89 good, 50-69 needs improvement, <50 poor"""
+
 
 def get_english_quality_prompt(docstring: str, api_name: str) -> str:
     """Prompt for English quality check (grammar, clarity, style).
@@ -200,7 +260,11 @@ Score guide: 90-100 comprehensive, 70-89 adequate, 50-69 incomplete, <50 severel
 
 
 def get_combined_quality_prompt(
-    signature: str, docstring: str, api_name: str, code_snippet: str | None = None
+    signature: str,
+    docstring: str,
+    api_name: str,
+    code_snippet: str | None = None,
+    max_issues: int | None = None,
 ) -> str:
     """Combined prompt for all quality checks (faster, single LLM call).
 
@@ -209,6 +273,7 @@ def get_combined_quality_prompt(
         docstring: The docstring
         api_name: Full API name
         code_snippet: Optional code body
+        max_issues: Ask for at most this many issues (no limit if None)
 
     Returns:
         Formatted prompt
@@ -222,7 +287,8 @@ Code implementation (excerpt):
 ```
 """
 
-    return f"""Think longer. You are a senior technical writer reviewing Python documentation for a quantum computing library with 15 years of experience.
+    return (
+        f"""Think longer. You are a senior technical writer reviewing Python documentation for a quantum computing library with 15 years of experience.
 
 Task: Comprehensive quality review of `{api_name}` documentation.
 
@@ -237,55 +303,68 @@ Docstring:
 ```
 {code_section}
 
-Check ALL of:
-1. **English Quality**: grammar, spelling, clarity, style
-2. **Code Alignment**: docstring matches signature and implementation
-3. **Completeness**: all parameters, returns, exceptions documented
-4. **Technical Accuracy**: correct terminology, accurate descriptions
+{_issue_limit(max_issues)}"""
+        + _COMBINED_QUALITY_FOOTER
+    )
 
-CRITICAL: Use simple, clear language. Provide concrete before/after examples for every issue.
 
-Respond ONLY with valid JSON (no markdown):
-{{
-  "issues": [
-    {{
-      "severity": "critical|warning|suggestion",
-      "category": "grammar|clarity|style|params|returns|exceptions|completeness|accuracy",
-      "message": "Simple explanation anyone can understand",
-      "suggestion": "Specific fix with before/after example",
-      "line_reference": "exact problematic text or null"
-    }}
-  ],
-  "score": 0-100,
-  "summary": "One sentence overall assessment"
-}}
+def get_batch_quality_prompt(
+    entries: list[tuple[str, str, str]], max_issues: int | None = None
+) -> str:
+    """Combined quality prompt covering several APIs in one LLM call.
 
-Example issue formats:
+    Args:
+        entries: (api_name, signature, docstring) per API, in order
+        max_issues: Ask for at most this many issues per API (no limit if None)
 
-Grammar issue:
-{{
-  "message": "Missing article 'the' makes sentence unclear",
-  "suggestion": "Change 'Evolves state' to 'Evolves the state'",
-  "line_reference": "Evolves state"
-}}
+    Returns:
+        Formatted prompt
+    """
+    sections = "\n".join(f"""### {i}. `{api_name}`
 
-Missing parameter:
-{{
-  "message": "Parameter 'dt' is not documented",
-  "suggestion": "Add: 'dt (float): Time step in nanoseconds. Default: 10'",
-  "line_reference": null
-}}
+Signature:
+```python
+{signature}
+```
 
-Incomplete description:
+Docstring:
+```
+{docstring}
+```
+""" for i, (api_name, signature, docstring) in enumerate(entries, 1))
+
+    return f"""Think longer. You are a senior technical writer reviewing Python documentation for a quantum computing library with 15 years of experience.
+
+Task: Comprehensive quality review of the {len(entries)} APIs below. Review each one independently.
+
+{sections}
+{_issue_limit(max_issues)}Check ALL of, for every API:
+{_QUALITY_CHECKS}
+
+Respond ONLY with valid JSON (no markdown), one entry per API using its exact name:
 {{
-  "message": "Doesn't explain what MPS truncation does",
-  "suggestion": "Add: 'Truncation removes small singular values to control memory, trading accuracy for performance'",
-  "line_reference": "Performs MPS truncation"
+  "apis": [
+    {{
+      "name": "full.api.name",
+      "issues": [
+        {{
+          "severity": "critical|warning|suggestion",
+          "category": "grammar|clarity|style|params|returns|exceptions|completeness|accuracy",
+          "message": "Simple explanation anyone can understand",
+          "suggestion": "Specific fix with before/after example",
+          "line_reference": "exact problematic text or null"
+        }}
+      ],
+      "score": 0-100
+    }}
+  ]
 }}
 
-Severity guide:
-- critical: Wrong info, missing required docs, major grammar errors
-- warning: Unclear phrasing, minor inconsistencies, missing nice-to-haves
-- suggestion: Style improvements, additional examples
+{_SEVERITY_GUIDE}"""
 
-Score guide: 90-100 excellent, 70-89 good, 50-69 needs improvement, <50 poor"""
+
+def _issue_limit(max_issues: int | None) -> str:
+    """Prompt paragraph capping issues per API; empty when unlimited."""
+    if max_issues is None:
+        return ""
+    return f"Report at most {max_issues} issues per API, most severe first.\n\n"
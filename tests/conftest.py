@@ -2,24 +2,151 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import os
+import sys
+from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from doc_checker.code_analyzer import CodeAnalyzer
+
+# Finder duplicates such as "test_checkers 2.py" still match test_*.py
+collect_ignore_glob = ["test_* [0-9].py"]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help='skip tests marked slow (same as -m "not slow")',
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("--fast"):
+        markexpr = config.option.markexpr
+        config.option.markexpr = f"({markexpr}) and not slow" if markexpr else "not slow"
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Deselect repeated and byte-identical tests; fail fast on duplicate basenames.
+
+    A duplicated test module silently runs every test in it twice; so does
+    a path given twice with --keep-duplicates, which repeats node ids. Dropped
+    tests are reported as deselected so the run summary counts them.
+    """
+    digests: dict[Path, bytes] = {}
+    owner: dict[bytes, Path] = {}
+    seen_ids: set[str] = set()
+    kept: list[pytest.Item] = []
+    dropped: list[pytest.Item] = []
+    for item in items:
+        if item.nodeid in seen_ids:
+            dropped.append(item)
+            continue
+        seen_ids.add(item.nodeid)
+        path = item.path
+        if path not in digests:
+            digests[path] = hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+        if owner.setdefault(digests[path], path) == path:
+            kept.append(item)
+        else:
+            dropped.append(item)
+    if dropped:
+        config.hook.pytest_deselected(items=dropped)
+        items[:] = kept
+
+    seen: dict[str, str] = {}
+    for nodepath in sorted({item.nodeid.split("::")[0] for item in items}):
+        name = Path(nodepath).name
+        if name in seen:
+            raise pytest.UsageError(
+                f"Duplicate test module {name}: {seen[name]}, {nodepath}"
+            )
+        seen[name] = nodepath
+
+
+@pytest.fixture(autouse=True)
+def _isolate_path_importer_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Drop finders cached for per-test sys.path entries at teardown.
+
+    Pairs with ``monkeypatch.syspath_prepend``: once the tmp dir leaves sys.path,
+    its FileFinder would otherwise linger in ``sys.path_importer_cache``.
+    """
+    monkeypatch.setattr(sys, "path_importer_cache", dict(sys.path_importer_cache))
+
+
+@pytest.fixture(autouse=True)
+def _drop_generated_modules(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Forget modules a test imported or re-imported from the pytest temp tree.
+
+    Packages written under basetemp often reuse names (my_lib, test_pkg), so a
+    cached copy would otherwise leak into later tests. Library modules imported
+    along the way stay cached. Under xdist the run-level temp root is used, since
+    shared trees live next to the worker basetemps rather than inside one.
+    """
+    before = dict(sys.modules)
+    yield
+    temp_root = tmp_path_factory.getbasetemp()
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        temp_root = temp_root.parent
+    prefix = str(temp_root)
+    for name, module in list(sys.modules.items()):
+        if module is before.get(name):
+            continue
+        origin = getattr(module, "__file__", None) or ""
+        if origin.startswith(prefix):
+            del sys.modules[name]
+
+
+@pytest.fixture
+def analyzer(tmp_path: Path) -> CodeAnalyzer:
+    """CodeAnalyzer with get_public_apis memoized per module name.
+
+    get_all_public_apis calls get_public_apis for the top-level module too,
+    so repeated lookups within a test hit the cache.
+    """
+    analyzer = CodeAnalyzer(tmp_path)
+    analyzer.get_public_apis = functools.lru_cache(maxsize=None)(  # type: ignore[method-assign]
+        analyzer.get_public_apis
+    )
+    return analyzer
+
+
+@pytest.fixture
+def quality_checker_mock() -> Iterator[tuple[MagicMock, MagicMock]]:
+    """Patch the QualityChecker class for the duration of a test.
+
+    Yields ``(mock_class, mock_instance)``; the instance's check_module_quality
+    returns ``[]`` unless a test overrides it.
+    """
+    with patch("doc_checker.llm_checker.QualityChecker") as mock_checker_class:
+        mock_checker_class.return_value = MagicMock(
+            check_module_quality=MagicMock(return_value=[])
+        )
+        yield mock_checker_class, mock_checker_class.return_value
+
 
 @pytest.fixture
 def tmp_docs(tmp_path: Path) -> Path:
-    """Create temporary docs directory."""
+    """Create temporary docs directory (per test, for tests that write docs)."""
     docs = tmp_path / "docs"
     docs.mkdir()
     return docs
 
 
-@pytest.fixture
-def sample_markdown(tmp_docs: Path) -> Path:
-    """Create sample markdown file."""
-    md_file = tmp_docs / "sample.md"
+@pytest.fixture(scope="session")
+def sample_markdown(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Sample markdown file, alone in its own session docs dir (read-only)."""
+    md_file = tmp_path_factory.mktemp("docs") / "sample.md"
     content = """
 # Sample Documentation
 
@@ -38,10 +165,10 @@ Local link: [example](../example.py)
     return md_file
 
 
-@pytest.fixture
-def sample_notebook(tmp_docs: Path) -> Path:
-    """Create sample Jupyter notebook."""
-    nb_file = tmp_docs / "sample.ipynb"
+@pytest.fixture(scope="session")
+def sample_notebook(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Sample Jupyter notebook, alone in its own session docs dir (read-only)."""
+    nb_file = tmp_path_factory.mktemp("docs") / "sample.ipynb"
     notebook = {
         "cells": [
             {
@@ -56,10 +183,10 @@ def sample_notebook(tmp_docs: Path) -> Path:
     return nb_file
 
 
-@pytest.fixture
-def sample_notebook_with_local_links(tmp_docs: Path) -> Path:
-    """Create sample Jupyter notebook with local links."""
-    nb_file = tmp_docs / "notebook_local.ipynb"
+@pytest.fixture(scope="session")
+def sample_notebook_with_local_links(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Notebook with local links, alone in its own session docs dir (read-only)."""
+    nb_file = tmp_path_factory.mktemp("docs") / "notebook_local.ipynb"
     notebook = {
         "cells": [
             {
@@ -85,10 +212,13 @@ def sample_notebook_with_local_links(tmp_docs: Path) -> Path:
     return nb_file
 
 
-@pytest.fixture
-def sample_mkdocs_yml(tmp_path: Path, tmp_docs: Path) -> Path:
-    """Create sample mkdocs.yml."""
-    mkdocs_file = tmp_path / "mkdocs.yml"
+@pytest.fixture(scope="session")
+def sample_mkdocs_yml(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Sample mkdocs.yml with its docs/ dir next to it (read-only)."""
+    root = tmp_path_factory.mktemp("mkdocs_project")
+    docs = root / "docs"
+    docs.mkdir()
+    mkdocs_file = root / "mkdocs.yml"
     content = """
 site_name: Test Docs
 nav:
@@ -99,8 +229,8 @@ nav:
     mkdocs_file.write_text(content)
 
     # Create referenced files
-    (tmp_docs / "index.md").write_text("# Home")
-    api_dir = tmp_docs / "api"
+    (docs / "index.md").write_text("# Home")
+    api_dir = docs / "api"
     api_dir.mkdir()
     (api_dir / "mps.md").write_text("# MPS API")
 
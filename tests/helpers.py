@@ -0,0 +1,34 @@
+"""Shared helpers for doc_checker tests."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+
+
+def purge_modules(*names: str) -> None:
+    """Forget ``names`` and their submodules so the next import re-discovers them.
+
+    Pops every matching ``sys.modules`` entry in one pass, then invalidates
+    importlib's finder caches once so freshly written files are seen.
+    """
+    prefixes = tuple(f"{name}." for name in names)
+    for key in [k for k in sys.modules if k in names or k.startswith(prefixes)]:
+        del sys.modules[key]
+    importlib.invalidate_caches()
+
+
+def materialize(root: Path, tree: Mapping[str, str | bytes]) -> Path:
+    """Write ``{relative path: content}`` under ``root`` and return ``root``.
+
+    Parent directories are created on demand, so callers list files only.
+    """
+    for rel, content in tree.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, str):
+            content = content.encode()
+        path.write_bytes(content)
+    return root
@@ -3,23 +3,25 @@
 from __future__ import annotations
 
 import json
-import sys
+import shutil
+from collections.abc import Iterable
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from doc_checker.checkers import DriftDetector
+from doc_checker.models import (
+    DriftReport,
+    ExternalLink,
+    LinkCheckResult,
+    QualityIssue,
+)
 
+from .helpers import materialize, purge_modules
 
-@pytest.fixture
-def test_project(tmp_path: Path) -> Path:
-    """Create a test project structure."""
-    # Create module
-    module_dir = tmp_path / "test_pkg"
-    module_dir.mkdir()
-    init_file = module_dir / "__init__.py"
-    code = '''
+# Base project sources, written as-is by _base_project
+_TEST_PKG_INIT = b'''
 """Test package."""
 
 __all__ = ["TestClass", "test_function"]
@@ -45,15 +47,8 @@ def test_function(x: int, y: int = 10) -> int:
     """
     return x + y
 '''
-    init_file.write_text(code)
-
-    # Create docs
-    docs_dir = tmp_path / "docs"
-    docs_dir.mkdir()
 
-    index_md = docs_dir / "index.md"
-    index_md.write_text(
-        """
+_INDEX_MD = b"""
 # Documentation
 
 ::: test_pkg.TestClass
@@ -61,29 +56,110 @@ def test_function(x: int, y: int = 10) -> int:
 External link: [Example](https://example.com)
 Local link: [Script](../script.py)
 """
-    )
 
-    # Create mkdocs.yml
-    mkdocs_yml = tmp_path / "mkdocs.yml"
-    mkdocs_yml.write_text(
-        """
+_MKDOCS_YML = b"""
 nav:
   - Home: index.md
 """
+
+# Notebook payloads used by the local-link tests, serialized once at import time
+_NB_GUIDE_LINK = json.dumps(
+    {"cells": [{"source": ["See [guide](../../advanced/guide/#section)\n"]}]}
+)
+_NB_TARGET_LINK = json.dumps(
+    {"cells": [{"source": ["See [other](../../../pkg_b/notebooks/target)\n"]}]}
+)
+_NB_TARGET_LINK_WITH_EXT = json.dumps(
+    {"cells": [{"source": ["See [other](../../../pkg_b/notebooks/target.ipynb)\n"]}]}
+)
+_NB_TARGET = json.dumps({"cells": [{"source": ["# Target"]}]})
+_NB_TUTORIAL = json.dumps({"cells": [{"source": ["# Tutorial"]}]})
+
+# Expected broken_local_links entries for the docstring-link tests; the anchor
+# is kept in "path" for docstring links
+_DS_BROKEN_GUIDE = {
+    "path": "../docs/missing.md",
+    "location": "link_pkg.Foo (docstring):1",
+    "text": "guide",
+}
+_DS_BROKEN_SECTION = {
+    "path": "missing.md#foo",
+    "location": "brk_pkg.X (docstring):1",
+    "text": "section",
+}
+
+
+def _broken_ref_names(report: DriftReport) -> set[str]:
+    """Broken ::: reference names, without their "in file:line" suffix."""
+    return {ref.split(" in ", 1)[0] for ref in report.broken_references}
+
+
+def _broken_link_paths(report: DriftReport) -> set[str]:
+    """Paths of all broken local links (anchors already stripped for doc links)."""
+    return {link["path"] for link in report.broken_local_links}
+
+
+class _FakeLinkChecker:
+    """LinkChecker stand-in that records check_links calls."""
+
+    def __init__(self, results: Iterable[LinkCheckResult] = ()):
+        self.results = list(results)
+        self.calls: list[tuple[list[ExternalLink], bool]] = []
+
+    def check_links(
+        self, links: list[ExternalLink], verbose: bool = False
+    ) -> list[LinkCheckResult]:
+        self.calls.append((list(links), verbose))
+        return self.results
+
+
+@pytest.fixture(scope="session")
+def _base_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the test project tree once per session; treat as read-only."""
+    return materialize(
+        tmp_path_factory.mktemp("base_project"),
+        {
+            "test_pkg/__init__.py": _TEST_PKG_INIT,
+            "docs/index.md": _INDEX_MD,
+            "mkdocs.yml": _MKDOCS_YML,
+        },
     )
 
-    # Add to sys.path
-    sys.path.insert(0, str(tmp_path))
 
-    return tmp_path
+@pytest.fixture(scope="session")
+def baseline_report(_base_project: Path) -> DriftReport:
+    """check_all() on the unmodified base project, shared by read-only tests."""
+    purge_modules("test_pkg")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.syspath_prepend(_base_project)
+        try:
+            return DriftDetector(_base_project, modules=["test_pkg"]).check_all()
+        finally:
+            purge_modules("test_pkg")
+
+
+@pytest.fixture
+def test_project(
+    tmp_path: Path, _base_project: Path, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Create a test project structure (a private copy of the base tree)."""
+    # Real copies, not hardlinks: tests rewrite files in place
+    project = tmp_path / "proj"
+    shutil.copytree(_base_project, project)
+
+    # Add to sys.path; drop any test_pkg cached by an earlier test (and stale
+    # finder caches) so results don't depend on execution order
+    monkeypatch.syspath_prepend(project)
+    purge_modules("test_pkg")
+
+    return project
 
 
 class TestDriftDetector:
     """Test DriftDetector."""
 
-    def test_check_api_coverage_missing(self, test_project: Path):
-        detector = DriftDetector(test_project, modules=["test_pkg"])
-        report = detector.check_all()
+    def test_check_api_coverage_missing(self, baseline_report: DriftReport):
+        report = baseline_report
 
         # test_function is missing from docs
         assert "test_pkg.test_function" in report.missing_in_docs
@@ -95,48 +171,42 @@ class TestDriftDetector:
 
         # Add test_function to docs
         index_md = test_project / "docs" / "index.md"
-        content = index_md.read_text()
-        content += "\n::: test_pkg.test_function\n"
-        index_md.write_text(content)
+        with index_md.open("a") as f:
+            f.write("\n::: test_pkg.test_function\n")
 
         report = detector.check_all()
         assert "test_pkg.test_function" not in report.missing_in_docs
 
-    def test_check_references_valid(self, test_project: Path):
-        detector = DriftDetector(test_project, modules=["test_pkg"])
-        report = detector.check_all()
+    def test_check_references_valid(self, baseline_report: DriftReport):
+        report = baseline_report
 
         # TestClass reference should be valid
-        assert not any("test_pkg.TestClass" in ref for ref in report.broken_references)
+        assert "test_pkg.TestClass" not in _broken_ref_names(report)
 
     def test_check_references_invalid(self, test_project: Path):
         # Add invalid reference
         index_md = test_project / "docs" / "index.md"
-        content = index_md.read_text()
-        content += "\n::: test_pkg.NonExistent\n"
-        index_md.write_text(content)
+        with index_md.open("a") as f:
+            f.write("\n::: test_pkg.NonExistent\n")
 
         detector = DriftDetector(test_project, modules=["test_pkg"])
         report = detector.check_all()
 
-        assert any("NonExistent" in ref for ref in report.broken_references)
+        assert "test_pkg.NonExistent" in _broken_ref_names(report)
 
-    def test_check_param_docs(self, test_project: Path):
-        detector = DriftDetector(test_project, modules=["test_pkg"])
-        report = detector.check_all()
+    def test_check_param_docs(self, baseline_report: DriftReport):
+        report = baseline_report
 
         # test_function has undocumented param 'y'
         undoc = [u for u in report.undocumented_params if "test_function" in u["name"]]
         assert len(undoc) == 1
         assert "y" in undoc[0]["params"]
 
-    def test_check_local_links_missing(self, test_project: Path):
-        detector = DriftDetector(test_project, modules=["test_pkg"])
-        report = detector.check_all()
+    def test_check_local_links_missing(self, baseline_report: DriftReport):
+        report = baseline_report
 
         # ../script.py doesn't exist
-        assert len(report.broken_local_links) == 1
-        assert "../script.py" in report.broken_local_links[0]["path"]
+        assert _broken_link_paths(report) == {"../script.py"}
 
     def test_check_local_links_exists(self, test_project: Path):
         # Create the script file
@@ -147,74 +217,58 @@ class TestDriftDetector:
         report = detector.check_all()
 
         # Link should now be valid
-        assert not any(
-            "../script.py" in link["path"] for link in report.broken_local_links
-        )
+        assert "../script.py" not in _broken_link_paths(report)
 
     def test_check_local_links_mkdocs_url_style(self, test_project: Path):
         """Test mkdocs URL-style resolution for notebook internal links."""
         # Create structure: docs/pkg/notebooks/tutorial.ipynb
         # with link ../../advanced/guide/ -> docs/pkg/advanced/guide.md
-        notebooks = test_project / "docs" / "pkg" / "notebooks"
-        notebooks.mkdir(parents=True)
-        advanced = test_project / "docs" / "pkg" / "advanced"
-        advanced.mkdir(parents=True)
-
-        # Create notebook with mkdocs-style internal link
-        nb = {"cells": [{"source": ["See [guide](../../advanced/guide/#section)\n"]}]}
-        (notebooks / "tutorial.ipynb").write_text(json.dumps(nb))
-
-        # Create target file (mkdocs resolves guide/ to guide.md)
-        (advanced / "guide.md").write_text("# Guide")
+        materialize(
+            test_project / "docs" / "pkg",
+            {
+                # Notebook with mkdocs-style internal link
+                "notebooks/tutorial.ipynb": _NB_GUIDE_LINK,
+                # Target file (mkdocs resolves guide/ to guide.md)
+                "advanced/guide.md": "# Guide",
+            },
+        )
 
         detector = DriftDetector(test_project, modules=["test_pkg"])
         report = detector.check_all()
 
         # Link should resolve via mkdocs URL-style (not file-style)
-        assert not any("guide" in link["path"] for link in report.broken_local_links)
+        assert "../../advanced/guide" not in _broken_link_paths(report)
 
     def test_check_local_links_notebook_without_extension(self, test_project: Path):
         """Test notebook link to notebook without .ipynb extension."""
         # Create structure: docs/pkg_a/notebooks/source.ipynb
         # with link ../../../pkg_b/notebooks/target -> docs/pkg_b/notebooks/target.ipynb
-        pkg_a = test_project / "docs" / "pkg_a" / "notebooks"
-        pkg_a.mkdir(parents=True)
-        pkg_b = test_project / "docs" / "pkg_b" / "notebooks"
-        pkg_b.mkdir(parents=True)
-
-        # Create notebook with link to another notebook without extension
-        nb = {"cells": [{"source": ["See [other](../../../pkg_b/notebooks/target)\n"]}]}
-        (pkg_a / "source.ipynb").write_text(json.dumps(nb))
-
-        # Create target notebook
-        target_nb = {"cells": [{"source": ["# Target"]}]}
-        (pkg_b / "target.ipynb").write_text(json.dumps(target_nb))
+        materialize(
+            test_project / "docs",
+            {
+                # Notebook with link to another notebook without extension
+                "pkg_a/notebooks/source.ipynb": _NB_TARGET_LINK,
+                "pkg_b/notebooks/target.ipynb": _NB_TARGET,
+            },
+        )
 
         detector = DriftDetector(test_project, modules=["test_pkg"])
         report = detector.check_all()
 
         # Link should resolve to .ipynb file (notebooks can omit extension)
-        assert not any("target" in link["path"] for link in report.broken_local_links)
+        assert "../../../pkg_b/notebooks/target" not in _broken_link_paths(report)
 
     def test_check_local_links_notebook_with_extension_broken(self, test_project: Path):
         """Test notebook link WITH .ipynb extension is flagged as broken."""
         # mkdocs-jupyter uses URL-style routing, so explicit .ipynb breaks
-        pkg_a = test_project / "docs" / "pkg_a" / "notebooks"
-        pkg_a.mkdir(parents=True)
-        pkg_b = test_project / "docs" / "pkg_b" / "notebooks"
-        pkg_b.mkdir(parents=True)
-
-        # Create notebook with link INCLUDING .ipynb extension (wrong for notebooks)
-        nb = {
-            "cells": [
-                {"source": ["See [other](../../../pkg_b/notebooks/target.ipynb)\n"]}
-            ]
-        }
-        (pkg_a / "source.ipynb").write_text(json.dumps(nb))
-
-        # Create target notebook
-        target_nb = {"cells": [{"source": ["# Target"]}]}
-        (pkg_b / "target.ipynb").write_text(json.dumps(target_nb))
+        materialize(
+            test_project / "docs",
+            {
+                # Link INCLUDING .ipynb extension (wrong for notebooks)
+                "pkg_a/notebooks/source.ipynb": _NB_TARGET_LINK_WITH_EXT,
+                "pkg_b/notebooks/target.ipynb": _NB_TARGET,
+            },
+        )
 
         detector = DriftDetector(test_project, modules=["test_pkg"])
         report = detector.check_all()
@@ -230,29 +284,25 @@ class TestDriftDetector:
         """Test markdown link to notebook MUST have .ipynb extension."""
         # Create structure: docs/benchmarks/perf.md
         # with link ../notebooks/tutorial (no extension) -> should be broken
-        benchmarks = test_project / "docs" / "benchmarks"
-        benchmarks.mkdir(parents=True)
-        notebooks = test_project / "docs" / "notebooks"
-        notebooks.mkdir(parents=True)
-
-        # Create markdown with link to notebook WITHOUT extension
-        (benchmarks / "perf.md").write_text(
-            "See [tutorial](../notebooks/tutorial) for details.\n"
+        materialize(
+            test_project / "docs",
+            {
+                # Markdown with link to notebook WITHOUT extension
+                "benchmarks/perf.md": (
+                    "See [tutorial](../notebooks/tutorial) for details.\n"
+                ),
+                "notebooks/tutorial.ipynb": _NB_TUTORIAL,
+            },
         )
 
-        # Create target notebook
-        target_nb = {"cells": [{"source": ["# Tutorial"]}]}
-        (notebooks / "tutorial.ipynb").write_text(json.dumps(target_nb))
-
         detector = DriftDetector(test_project, modules=["test_pkg"])
         report = detector.check_all()
 
         # Link should be broken - markdown files must include .ipynb extension
-        assert any("tutorial" in link["path"] for link in report.broken_local_links)
+        assert "../notebooks/tutorial" in _broken_link_paths(report)
 
-    def test_check_mkdocs_paths(self, test_project: Path):
-        detector = DriftDetector(test_project, modules=["test_pkg"])
-        report = detector.check_all()
+    def test_check_mkdocs_paths(self, baseline_report: DriftReport):
+        report = baseline_report
 
         # index.md exists, so no broken paths
         assert len(report.broken_mkdocs_paths) == 0
@@ -260,9 +310,8 @@ class TestDriftDetector:
     def test_check_mkdocs_paths_broken(self, test_project: Path):
         # Add broken path to mkdocs.yml
         mkdocs_yml = test_project / "mkdocs.yml"
-        content = mkdocs_yml.read_text()
-        content += "  - Missing: missing.md\n"
-        mkdocs_yml.write_text(content)
+        with mkdocs_yml.open("a") as f:
+            f.write("  - Missing: missing.md\n")
 
         detector = DriftDetector(test_project, modules=["test_pkg"])
         report = detector.check_all()
@@ -272,10 +321,10 @@ class TestDriftDetector:
 
     def test_ignore_pulser_reexports(self, test_project: Path):
         # Create module with Pulser re-export
-        module_dir = test_project / "test_pulser"
-        module_dir.mkdir()
-        init_file = module_dir / "__init__.py"
-        init_file.write_text('__all__ = ["Results"]\nclass Results: pass')
+        materialize(
+            test_project,
+            {"test_pulser/__init__.py": '__all__ = ["Results"]\nclass Results: pass'},
+        )
 
         detector = DriftDetector(
             test_project, modules=["test_pulser"], ignore_pulser_reexports=True
@@ -285,28 +334,34 @@ class TestDriftDetector:
         # Results should be ignored
         assert "test_pulser.Results" not in report.missing_in_docs
 
-    def test_has_issues(self, test_project: Path):
+    def test_missing_mkdocs_yml_tolerated(self, test_project: Path):
+        """Missing mkdocs.yml skips nav checks instead of failing."""
+        (test_project / "mkdocs.yml").unlink()
+
         detector = DriftDetector(test_project, modules=["test_pkg"])
         report = detector.check_all()
 
+        assert report.broken_mkdocs_paths == []
+        assert "test_pkg.test_function" in report.missing_in_docs
+
+    def test_has_issues(self, baseline_report: DriftReport):
+        report = baseline_report
+
         # Should have issues (missing APIs, undocumented params, broken links)
         assert report.has_issues() is True
 
-    def test_no_issues(self, tmp_path: Path):
+    def test_no_issues(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         # Create minimal project with everything documented
-        module_dir = tmp_path / "perfect_pkg"
-        module_dir.mkdir()
-        init_file = module_dir / "__init__.py"
-        init_file.write_text('__all__ = []\n"""Perfect package."""')
-
-        docs_dir = tmp_path / "docs"
-        docs_dir.mkdir()
-        (docs_dir / "index.md").write_text("# Docs")
-
-        mkdocs_yml = tmp_path / "mkdocs.yml"
-        mkdocs_yml.write_text("nav:\n  - Home: index.md\n")
+        materialize(
+            tmp_path,
+            {
+                "perfect_pkg/__init__.py": '__all__ = []\n"""Perfect package."""',
+                "docs/index.md": "# Docs",
+                "mkdocs.yml": "nav:\n  - Home: index.md\n",
+            },
+        )
 
-        sys.path.insert(0, str(tmp_path))
+        monkeypatch.syspath_prepend(tmp_path)
 
         detector = DriftDetector(tmp_path, modules=["perfect_pkg"])
         report = detector.check_all()
@@ -315,16 +370,15 @@ class TestDriftDetector:
 
     def test_check_api_coverage_submodule(self, test_project: Path):
         """Submodule APIs detected as missing from docs."""
-        sub = test_project / "test_pkg" / "sub"
-        sub.mkdir()
-        (sub / "__init__.py").write_text(
-            '__all__ = ["SubHelper"]\nclass SubHelper:\n    "sub helper"\n'
+        materialize(
+            test_project,
+            {
+                "test_pkg/sub/__init__.py": (
+                    '__all__ = ["SubHelper"]\nclass SubHelper:\n    "sub helper"\n'
+                )
+            },
         )
 
-        # Reimport so walk_packages finds the subpackage
-        sys.modules.pop("test_pkg", None)
-        sys.modules.pop("test_pkg.sub", None)
-
         detector = DriftDetector(test_project, modules=["test_pkg"])
         report = detector.check_all()
 
@@ -332,15 +386,15 @@ class TestDriftDetector:
 
     def test_ignore_submodules(self, test_project: Path):
         """ignore_submodules excludes submodule APIs from coverage."""
-        sub = test_project / "test_pkg" / "ignored"
-        sub.mkdir()
-        (sub / "__init__.py").write_text(
-            '__all__ = ["Hidden"]\nclass Hidden:\n    "hidden"\n'
+        materialize(
+            test_project,
+            {
+                "test_pkg/ignored/__init__.py": (
+                    '__all__ = ["Hidden"]\nclass Hidden:\n    "hidden"\n'
+                )
+            },
         )
 
-        sys.modules.pop("test_pkg", None)
-        sys.modules.pop("test_pkg.ignored", None)
-
         detector = DriftDetector(
             test_project,
             modules=["test_pkg"],
@@ -350,12 +404,12 @@ class TestDriftDetector:
 
         assert not any("Hidden" in m for m in report.missing_in_docs)
 
-    def test_skip_basic_checks(self, test_project: Path):
+    def test_skip_basic_checks(self, test_project: Path, baseline_report: DriftReport):
         """Test skip_basic_checks=True skips API coverage, refs, params, local links."""
         detector = DriftDetector(test_project, modules=["test_pkg"])
 
         # Without skip: should have issues (missing API, broken local link, etc.)
-        report_full = detector.check_all()
+        report_full = baseline_report
         assert len(report_full.missing_in_docs) > 0
         assert len(report_full.broken_local_links) > 0
 
@@ -371,191 +425,204 @@ class TestDriftDetector:
 class TestDocstringLocalLinks:
     """Tests for broken local links in Python docstrings."""
 
-    def test_docstring_broken_local_link(self, tmp_path: Path):
+    def test_docstring_broken_local_link(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Broken link in docstring detected."""
-        mod = tmp_path / "link_pkg"
-        mod.mkdir()
-        (mod / "__init__.py").write_text(
-            '__all__ = ["Foo"]\n'
-            "class Foo:\n"
-            '    """See [guide](../docs/missing.md) for details."""\n'
+        materialize(
+            tmp_path,
+            {
+                "link_pkg/__init__.py": (
+                    '__all__ = ["Foo"]\n'
+                    "class Foo:\n"
+                    '    """See [guide](../docs/missing.md) for details."""\n'
+                ),
+                "docs/index.md": "# Docs\n::: link_pkg.Foo\n",
+            },
         )
-        docs = tmp_path / "docs"
-        docs.mkdir()
-        (docs / "index.md").write_text("# Docs\n::: link_pkg.Foo\n")
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: index.md\n")
-        sys.path.insert(0, str(tmp_path))
-        try:
-            detector = DriftDetector(tmp_path, modules=["link_pkg"])
-            report = detector.check_all()
-            broken = [
-                b for b in report.broken_local_links if "docstring" in b["location"]
-            ]
-            assert len(broken) == 1
-            assert "missing.md" in broken[0]["path"]
-            assert "link_pkg.Foo" in broken[0]["location"]
-        finally:
-            sys.modules.pop("link_pkg", None)
+        monkeypatch.syspath_prepend(tmp_path)
+        detector = DriftDetector(tmp_path, modules=["link_pkg"])
+        report = detector.check_all()
+        broken = [b for b in report.broken_local_links if "docstring" in b["location"]]
+        assert broken == [_DS_BROKEN_GUIDE]
 
-    def test_docstring_valid_local_link(self, tmp_path: Path):
+    def test_docstring_valid_local_link(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Valid link in docstring not flagged."""
-        mod = tmp_path / "ok_pkg"
-        mod.mkdir()
-        (mod / "__init__.py").write_text(
-            '__all__ = ["Bar"]\n'
-            "class Bar:\n"
-            '    """See [guide](guide.md) for info."""\n'
+        materialize(
+            tmp_path,
+            {
+                "ok_pkg/__init__.py": (
+                    '__all__ = ["Bar"]\n'
+                    "class Bar:\n"
+                    '    """See [guide](guide.md) for info."""\n'
+                ),
+                "docs/index.md": "# Docs\n::: ok_pkg.Bar\n",
+                "docs/guide.md": "# Guide\n",
+            },
         )
-        docs = tmp_path / "docs"
-        docs.mkdir()
-        (docs / "index.md").write_text("# Docs\n::: ok_pkg.Bar\n")
-        (docs / "guide.md").write_text("# Guide\n")
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: index.md\n")
-        sys.path.insert(0, str(tmp_path))
-        try:
-            detector = DriftDetector(tmp_path, modules=["ok_pkg"])
-            report = detector.check_all()
-            broken = [
-                b for b in report.broken_local_links if "docstring" in b["location"]
-            ]
-            assert len(broken) == 0
-        finally:
-            sys.modules.pop("ok_pkg", None)
+        monkeypatch.syspath_prepend(tmp_path)
+        detector = DriftDetector(tmp_path, modules=["ok_pkg"])
+        report = detector.check_all()
+        broken = [b for b in report.broken_local_links if "docstring" in b["location"]]
+        assert len(broken) == 0
 
-    def test_docstring_link_with_anchor_valid(self, tmp_path: Path):
+    def test_docstring_link_with_anchor_valid(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Link with #fragment resolves when file exists."""
-        mod = tmp_path / "anchor_pkg"
-        mod.mkdir()
-        (mod / "__init__.py").write_text(
-            '__all__ = ["Cfg"]\n'
-            "class Cfg:\n"
-            '    """Check [precision](advanced/config.md#precision)."""\n'
+        materialize(
+            tmp_path,
+            {
+                "anchor_pkg/__init__.py": (
+                    '__all__ = ["Cfg"]\n'
+                    "class Cfg:\n"
+                    '    """Check [precision](advanced/config.md#precision)."""\n'
+                ),
+                "docs/advanced/config.md": "# Config\n## precision\n",
+                "docs/index.md": "# Docs\n::: anchor_pkg.Cfg\n",
+            },
         )
-        docs = tmp_path / "docs"
-        docs.mkdir()
-        adv = docs / "advanced"
-        adv.mkdir()
-        (adv / "config.md").write_text("# Config\n## precision\n")
-        (docs / "index.md").write_text("# Docs\n::: anchor_pkg.Cfg\n")
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: index.md\n")
-        sys.path.insert(0, str(tmp_path))
-        try:
-            detector = DriftDetector(tmp_path, modules=["anchor_pkg"])
-            report = detector.check_all()
-            broken = [
-                b for b in report.broken_local_links if "docstring" in b["location"]
-            ]
-            assert len(broken) == 0
-        finally:
-            sys.modules.pop("anchor_pkg", None)
+        monkeypatch.syspath_prepend(tmp_path)
+        detector = DriftDetector(tmp_path, modules=["anchor_pkg"])
+        report = detector.check_all()
+        broken = [b for b in report.broken_local_links if "docstring" in b["location"]]
+        assert len(broken) == 0
 
-    def test_docstring_link_with_anchor_broken(self, tmp_path: Path):
+    def test_docstring_link_with_anchor_broken(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Link with #fragment flagged when file missing."""
-        mod = tmp_path / "brk_pkg"
-        mod.mkdir()
-        (mod / "__init__.py").write_text(
-            '__all__ = ["X"]\n' "class X:\n" '    """See [section](missing.md#foo)."""\n'
+        materialize(
+            tmp_path,
+            {
+                "brk_pkg/__init__.py": (
+                    '__all__ = ["X"]\n'
+                    "class X:\n"
+                    '    """See [section](missing.md#foo)."""\n'
+                ),
+                "docs/index.md": "# Docs\n::: brk_pkg.X\n",
+            },
         )
-        docs = tmp_path / "docs"
-        docs.mkdir()
-        (docs / "index.md").write_text("# Docs\n::: brk_pkg.X\n")
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: index.md\n")
-        sys.path.insert(0, str(tmp_path))
-        try:
-            detector = DriftDetector(tmp_path, modules=["brk_pkg"])
-            report = detector.check_all()
-            broken = [
-                b for b in report.broken_local_links if "docstring" in b["location"]
-            ]
-            assert len(broken) == 1
-            assert "missing.md#foo" in broken[0]["path"]
-        finally:
-            sys.modules.pop("brk_pkg", None)
+        monkeypatch.syspath_prepend(tmp_path)
+        detector = DriftDetector(tmp_path, modules=["brk_pkg"])
+        report = detector.check_all()
+        broken = [b for b in report.broken_local_links if "docstring" in b["location"]]
+        assert broken == [_DS_BROKEN_SECTION]
 
-    def test_docstring_link_resolves_relative_to_mkdocstrings_page(self, tmp_path: Path):
+    def test_docstring_link_resolves_relative_to_mkdocstrings_page(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Link resolves relative to the ::: page, not docs root."""
-        mod = tmp_path / "rel_pkg"
-        mod.mkdir()
-        # Docstring has relative link "advanced/config.md"
-        (mod / "__init__.py").write_text(
-            '__all__ = ["Cls"]\n'
-            "class Cls:\n"
-            '    """See [cfg](advanced/config.md)."""\n'
+        materialize(
+            tmp_path,
+            {
+                # Docstring has relative link "advanced/config.md"
+                "rel_pkg/__init__.py": (
+                    '__all__ = ["Cls"]\n'
+                    "class Cls:\n"
+                    '    """See [cfg](advanced/config.md)."""\n'
+                ),
+                # ::: ref lives in docs/rel_pkg/api.md
+                "docs/rel_pkg/api.md": "::: rel_pkg.Cls\n",
+                # Target file at docs/rel_pkg/advanced/config.md
+                "docs/rel_pkg/advanced/config.md": "# Config\n",
+                "docs/index.md": "# Docs\n",
+            },
         )
-        docs = tmp_path / "docs"
-        sub = docs / "rel_pkg"
-        sub.mkdir(parents=True)
-        # ::: ref lives in docs/rel_pkg/api.md
-        (sub / "api.md").write_text("::: rel_pkg.Cls\n")
-        # Target file at docs/rel_pkg/advanced/config.md
-        adv = sub / "advanced"
-        adv.mkdir()
-        (adv / "config.md").write_text("# Config\n")
-        (docs / "index.md").write_text("# Docs\n")
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: index.md\n")
-        sys.path.insert(0, str(tmp_path))
-        try:
-            detector = DriftDetector(tmp_path, modules=["rel_pkg"])
-            report = detector.check_all()
-            broken = [
-                b for b in report.broken_local_links if "docstring" in b["location"]
-            ]
-            # Should NOT be flagged — resolves from api.md's dir
-            assert len(broken) == 0
-        finally:
-            sys.modules.pop("rel_pkg", None)
+        monkeypatch.syspath_prepend(tmp_path)
+        detector = DriftDetector(tmp_path, modules=["rel_pkg"])
+        report = detector.check_all()
+        broken = [b for b in report.broken_local_links if "docstring" in b["location"]]
+        # Should NOT be flagged — resolves from api.md's dir
+        assert len(broken) == 0
 
-    def test_docstring_link_resolves_with_reexported_api(self, tmp_path: Path):
+    def test_docstring_link_resolves_with_reexported_api(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Link resolves when ::: uses full path but API is re-exported.
 
         Simulates: ::: pkg.sub.Cls in docs/pkg/api.md, but API discovered
         as pkg.Cls via __init__.py re-export.
         """
-        pkg = tmp_path / "reexp_pkg"
-        pkg.mkdir()
-        sub = pkg / "sub"
-        sub.mkdir()
-        (sub / "__init__.py").write_text(
-            "class Cls:\n" '    """See [cfg](advanced/config.md)."""\n'
+        materialize(
+            tmp_path,
+            {
+                "reexp_pkg/sub/__init__.py": (
+                    "class Cls:\n" '    """See [cfg](advanced/config.md)."""\n'
+                ),
+                "reexp_pkg/__init__.py": 'from .sub import Cls\n__all__ = ["Cls"]\n',
+                # ::: uses full submodule path
+                "docs/reexp_pkg/api.md": "::: reexp_pkg.sub.Cls\n",
+                "docs/reexp_pkg/advanced/config.md": "# Config\n",
+                "docs/index.md": "# Docs\n",
+            },
         )
-        (pkg / "__init__.py").write_text('from .sub import Cls\n__all__ = ["Cls"]\n')
-        docs = tmp_path / "docs"
-        pkg_docs = docs / "reexp_pkg"
-        pkg_docs.mkdir(parents=True)
-        # ::: uses full submodule path
-        (pkg_docs / "api.md").write_text("::: reexp_pkg.sub.Cls\n")
-        adv = pkg_docs / "advanced"
-        adv.mkdir()
-        (adv / "config.md").write_text("# Config\n")
-        (docs / "index.md").write_text("# Docs\n")
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: index.md\n")
-        sys.path.insert(0, str(tmp_path))
-        try:
-            detector = DriftDetector(tmp_path, modules=["reexp_pkg"])
-            report = detector.check_all()
-            broken = [
-                b for b in report.broken_local_links if "docstring" in b["location"]
-            ]
-            assert len(broken) == 0
-        finally:
-            sys.modules.pop("reexp_pkg", None)
-            sys.modules.pop("reexp_pkg.sub", None)
+        monkeypatch.syspath_prepend(tmp_path)
+        detector = DriftDetector(tmp_path, modules=["reexp_pkg"])
+        report = detector.check_all()
+        broken = [b for b in report.broken_local_links if "docstring" in b["location"]]
+        assert len(broken) == 0
+
+
+class TestExternalLinks:
+    """Tests for the external link check wiring in DriftDetector."""
+
+    def test_verbose_passed_to_link_checker(self, _base_project: Path):
+        detector = DriftDetector(_base_project, modules=["test_pkg"])
+        fake = detector.link_checker = _FakeLinkChecker()
+
+        detector._check_external_links(DriftReport(), verbose=True)
+
+        ((links, verbose),) = fake.calls
+        assert [link.url for link in links] == ["https://example.com"]
+        assert verbose is True
+
+    def test_broken_results_reported(self, _base_project: Path):
+        broken = ExternalLink(
+            url="https://broken.invalid/page",
+            text="Broken",
+            file_path=Path("docs/api.md"),
+            line_number=12,
+        )
+        results = [
+            LinkCheckResult(broken, status_code=404, error=None, is_broken=True),
+            LinkCheckResult(broken, status_code=None, error="Timeout", is_broken=True),
+            LinkCheckResult(broken, status_code=403, error=None, is_broken=False),
+        ]
+        detector = DriftDetector(_base_project, modules=["test_pkg"])
+        detector.link_checker = _FakeLinkChecker(results)
+
+        report = DriftReport()
+        detector._check_external_links(report, verbose=False)
+
+        assert report.total_external_links == 1
+        assert report.broken_external_links == [
+            {
+                "url": "https://broken.invalid/page",
+                "status": 404,
+                "location": "docs/api.md:12",
+                "text": "Broken",
+            },
+            {
+                "url": "https://broken.invalid/page",
+                "status": "Timeout",
+                "location": "docs/api.md:12",
+                "text": "Broken",
+            },
+        ]
 
 
 class TestQualityChecks:
     """Tests for LLM quality checks integration."""
 
-    def test_check_quality_disabled_by_default(self, test_project: Path):
+    def test_check_quality_disabled_by_default(self, baseline_report: DriftReport):
         """Test quality checks not run by default."""
-        detector = DriftDetector(test_project, modules=["test_pkg"])
-        report = detector.check_all()
-
-        assert len(report.quality_issues) == 0
+        assert len(baseline_report.quality_issues) == 0
 
     def test_check_quality_missing_dependency(self, test_project: Path):
         """Test quality checks gracefully handle missing dependencies."""
-        from unittest.mock import patch
-
         detector = DriftDetector(test_project, modules=["test_pkg"])
 
         with patch("doc_checker.checkers.importlib.import_module") as mock_import:
@@ -566,87 +633,120 @@ class TestQualityChecks:
         assert len(report.warnings) > 0
         assert any("Quality checks skipped" in w for w in report.warnings)
 
-    def test_check_quality_enabled(self, test_project: Path):
+    def test_check_quality_enabled(
+        self, test_project: Path, quality_checker_mock: tuple[MagicMock, MagicMock]
+    ):
         """Test quality checks run when enabled."""
-        from unittest.mock import MagicMock, patch
-
         detector = DriftDetector(test_project, modules=["test_pkg"])
 
         # Mock the quality checker
-        mock_checker = MagicMock()
-        mock_checker.check_module_quality.return_value = [
-            MagicMock(
-                api_name="test_pkg.test_function",
-                severity="warning",
-                category="grammar",
-                message="Test issue",
-                suggestion="Fix it",
-                line_reference="test",
-            )
-        ]
+        issue = QualityIssue(
+            api_name="test_pkg.test_function",
+            severity="warning",
+            category="grammar",
+            message="Test issue",
+            suggestion="Fix it",
+            line_reference="test",
+        )
 
-        with patch("doc_checker.llm_checker.QualityChecker") as mock_checker_class:
-            mock_checker_class.return_value = mock_checker
-            report = detector.check_all(
-                check_quality=True,
-                quality_backend="ollama",
-                quality_model="qwen2.5:3b",
-            )
+        _, mock_checker = quality_checker_mock
+        mock_checker.check_module_quality.return_value = [issue]
+        report = detector.check_all(
+            check_quality=True,
+            quality_backend="ollama",
+            quality_model="qwen2.5:3b",
+        )
 
         assert len(report.quality_issues) == 1
         assert report.quality_issues[0].api_name == "test_pkg.test_function"
 
-    def test_check_quality_with_sample_rate(self, test_project: Path):
+    def test_check_quality_with_sample_rate(
+        self, test_project: Path, quality_checker_mock: tuple[MagicMock, MagicMock]
+    ):
         """Test quality checks with sampling."""
-        from unittest.mock import MagicMock, patch
+        detector = DriftDetector(test_project, modules=["test_pkg"])
+        detector.check_all(check_quality=True, quality_sample_rate=0.5, verbose=True)
+
+        # Verify sample_rate was passed
+        _, mock_checker = quality_checker_mock
+        mock_checker.check_module_quality.assert_called_with("test_pkg", True, 0.5, 1)
 
+    def test_check_quality_with_max_concurrent(
+        self, test_project: Path, quality_checker_mock: tuple[MagicMock, MagicMock]
+    ):
+        """quality_max_concurrent reaches check_module_quality."""
         detector = DriftDetector(test_project, modules=["test_pkg"])
+        detector.check_all(check_quality=True, quality_max_concurrent=4)
 
-        mock_checker = MagicMock()
-        mock_checker.check_module_quality.return_value = []
+        _, mock_checker = quality_checker_mock
+        mock_checker.check_module_quality.assert_called_with("test_pkg", False, 1.0, 4)
 
-        with patch("doc_checker.llm_checker.QualityChecker") as mock_checker_class:
-            mock_checker_class.return_value = mock_checker
-            detector.check_all(check_quality=True, quality_sample_rate=0.5, verbose=True)
+    def test_check_quality_batched(
+        self, test_project: Path, quality_checker_mock: tuple[MagicMock, MagicMock]
+    ):
+        """quality_batch_size switches to check_module_quality_batched."""
+        detector = DriftDetector(test_project, modules=["test_pkg"])
+        detector.check_all(check_quality=True, quality_batch_size=8)
 
-        # Verify sample_rate was passed
-        mock_checker.check_module_quality.assert_called_with("test_pkg", True, 0.5)
+        _, mock_checker = quality_checker_mock
+        mock_checker.check_module_quality_batched.assert_called_once_with(
+            "test_pkg", False, 1.0, 8
+        )
+        mock_checker.check_module_quality.assert_not_called()
 
-    def test_check_quality_backend_error(self, test_project: Path):
-        """Test quality checks handle backend initialization errors."""
-        from unittest.mock import patch
+    def test_check_quality_batched_warns_on_ignored_options(
+        self, test_project: Path, quality_checker_mock: tuple[MagicMock, MagicMock]
+    ):
+        """Cache and concurrency settings unused by the batched path are reported."""
+        detector = DriftDetector(test_project, modules=["test_pkg"])
+        report = detector.check_all(
+            check_quality=True, quality_batch_size=8, quality_use_cache=True
+        )
 
+        assert any("ignore the result cache" in w for w in report.warnings)
+
+    def test_check_quality_use_cache(
+        self, test_project: Path, quality_checker_mock: tuple[MagicMock, MagicMock]
+    ):
+        """quality_use_cache is passed to the QualityChecker constructor."""
         detector = DriftDetector(test_project, modules=["test_pkg"])
+        detector.check_all(check_quality=True, quality_use_cache=True)
 
-        with patch("doc_checker.llm_checker.QualityChecker") as mock_checker_class:
-            mock_checker_class.side_effect = RuntimeError("Ollama not running")
-            report = detector.check_all(check_quality=True)
+        mock_checker_class, _ = quality_checker_mock
+        assert mock_checker_class.call_args.kwargs["use_cache"] is True
+
+    def test_check_quality_backend_error(
+        self, test_project: Path, quality_checker_mock: tuple[MagicMock, MagicMock]
+    ):
+        """Test quality checks handle backend initialization errors."""
+        detector = DriftDetector(test_project, modules=["test_pkg"])
+
+        mock_checker_class, _ = quality_checker_mock
+        mock_checker_class.side_effect = RuntimeError("Ollama not running")
+        report = detector.check_all(check_quality=True)
 
         # Should add warning, not crash
         assert len(report.warnings) > 0
         assert any("Ollama not running" in w for w in report.warnings)
 
-    def test_quality_issues_in_has_issues(self, test_project: Path):
+    def test_quality_issues_in_has_issues(
+        self, test_project: Path, quality_checker_mock: tuple[MagicMock, MagicMock]
+    ):
         """Test quality issues contribute to has_issues()."""
-        from unittest.mock import MagicMock, patch
-
         detector = DriftDetector(test_project, modules=["test_pkg"])
 
-        mock_checker = MagicMock()
-        mock_checker.check_module_quality.return_value = [
-            MagicMock(
-                api_name="test",
-                severity="critical",
-                category="params",
-                message="Missing param",
-                suggestion="Add it",
-                line_reference=None,
-            )
-        ]
+        issue = QualityIssue(
+            api_name="test",
+            severity="critical",
+            category="params",
+            message="Missing param",
+            suggestion="Add it",
+            line_reference=None,
+        )
 
-        with patch("doc_checker.llm_checker.QualityChecker") as mock_checker_class:
-            mock_checker_class.return_value = mock_checker
-            report = detector.check_all(check_quality=True)
+        _, mock_checker = quality_checker_mock
+        mock_checker.check_module_quality.return_value = [issue]
+        report = detector.check_all(check_quality=True)
 
         assert report.has_issues() is True
         assert len(report.quality_issues) > 0
@@ -707,7 +807,6 @@ class TestHelperMethods:
         docs.mkdir()
         (docs / "page.md").write_text("# Page")
         (docs / "other.md").write_text("# Other")
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: page.md\n")
 
         detector = DriftDetector(tmp_path, modules=[])
         result = detector._resolve_path(docs, "other.md", ".md")
@@ -722,7 +821,6 @@ class TestHelperMethods:
         sub.mkdir(parents=True)
         (docs / "index.md").write_text("# Index")
         (sub / "page.md").write_text("# Page")
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: index.md\n")
 
         detector = DriftDetector(tmp_path, modules=[])
         # From sub/, link to ../index.md
@@ -737,7 +835,6 @@ class TestHelperMethods:
         docs.mkdir()
         script = tmp_path / "script.py"
         script.write_text("# Script")
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: index.md\n")
         (docs / "index.md").write_text("# Index")
 
         detector = DriftDetector(tmp_path, modules=[])
@@ -750,7 +847,6 @@ class TestHelperMethods:
         """Test _resolve_path returns None for missing files."""
         docs = tmp_path / "docs"
         docs.mkdir()
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: index.md\n")
         (docs / "index.md").write_text("# Index")
 
         detector = DriftDetector(tmp_path, modules=[])
@@ -763,7 +859,6 @@ class TestHelperMethods:
         docs = tmp_path / "docs"
         docs.mkdir()
         (docs / "guide.md").write_text("# Guide")
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: index.md\n")
 
         detector = DriftDetector(tmp_path, modules=[])
         result = detector._resolve_ds_link("guide.md", docs, docs)
@@ -777,7 +872,6 @@ class TestHelperMethods:
         sub = docs / "api"
         sub.mkdir(parents=True)
         (docs / "guide.md").write_text("# Guide")
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: guide.md\n")
 
         detector = DriftDetector(tmp_path, modules=[])
         # Link from api/ to ../guide.md
@@ -790,7 +884,6 @@ class TestHelperMethods:
         """Test _resolve_ds_link returns None for missing files."""
         docs = tmp_path / "docs"
         docs.mkdir()
-        (tmp_path / "mkdocs.yml").write_text("nav:\n  - Home: index.md\n")
 
         detector = DriftDetector(tmp_path, modules=[])
         result = detector._resolve_ds_link("missing.md", docs, docs)
@@ -3,23 +3,16 @@
 from __future__ import annotations
 
 import sys
+import zipfile
 from pathlib import Path
 from types import ModuleType
 
 import pytest
 
 from doc_checker.code_analyzer import CodeAnalyzer
+from doc_checker.models import SignatureInfo
 
-
-@pytest.fixture
-def sample_module(tmp_path: Path) -> ModuleType:
-    """Create a sample Python module for testing."""
-    module_dir = tmp_path / "test_module"
-    module_dir.mkdir()
-
-    # Create __init__.py with sample code
-    init_file = module_dir / "__init__.py"
-    code = '''
+_SAMPLE_INIT = '''
 """Sample module for testing."""
 
 __all__ = ["PublicClass", "public_function"]
@@ -52,32 +45,93 @@ class _PrivateClass:
     """Should not be included."""
     pass
 '''
-    init_file.write_text(code)
 
-    # Add to sys.path and import
-    sys.path.insert(0, str(tmp_path))
-    import test_module
+_NO_ALL_INIT = b'''
+"""Module without __all__."""
+
+def public_func():
+    """Public function."""
+    pass
+
+def _private_func():
+    """Private function."""
+    pass
+'''
+
+_EXPECTED_TEST_MODULE = frozenset({"PublicClass", "public_function"})
+_EXPECTED_NO_ALL = frozenset({"public_func"})
+
+# Compiled once per process; sample_module execs it instead of importing
+_SAMPLE_CODE = compile(_SAMPLE_INIT, "<test_module>", "exec")
+
+# Mini-packages for the parametrized get_all_public_apis tests, served from a
+# zip archive and keyed by path
+_PKG_TREE = {
+    "nested_pkg/__init__.py": '__all__ = ["TopFunc"]\ndef TopFunc(): "top"\n',
+    "nested_pkg/sub/__init__.py": '__all__ = ["SubFunc"]\ndef SubFunc(): "sub"\n',
+    "ign_pkg/__init__.py": '__all__ = ["Top"]\ndef Top(): "top"\n',
+    "ign_pkg/skip_me/__init__.py": '__all__ = ["Skipped"]\ndef Skipped(): "skip"\n',
+    "ign_pkg/keep/__init__.py": '__all__ = ["Kept"]\ndef Kept(): "keep"\n',
+    "warn_pkg/__init__.py": '__all__ = ["W"]\ndef W(): "w"\n',
+    # Need a real subpackage so the warning logic runs
+    "warn_pkg/real_sub/__init__.py": "__all__ = []\n",
+    "other_pkg/__init__.py": '__all__ = ["F"]\ndef F(): "f"\n',
+    "flat_pkg/__init__.py": (
+        '__all__ = ["Public"]\n' "from .internal import Internal as Public\n"
+    ),
+    # .py file with its own classes — should NOT be discovered
+    "flat_pkg/internal.py": 'class Internal:\n    "impl detail"\n',
+    "partial_pkg/__init__.py": '__all__ = ["Top"]\nclass Top: pass\n',
+    "partial_pkg/bad_sub/__init__.py": "import nonexistent_dep\n",
+}
+
+
+@pytest.fixture(scope="session")
+def pkg_zip(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Archive every package in _PKG_TREE into one zip, once per session.
+
+    Read-only tests import straight from the archive via zipimport, so they
+    share a single cached zip directory instead of writing files per test.
+    """
+    path = tmp_path_factory.mktemp("pkgs") / "pkgs.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        for rel, source in _PKG_TREE.items():
+            zf.writestr(rel, source)
+    return path
+
+
+def _install_sample_module(mp: pytest.MonkeyPatch) -> ModuleType:
+    """Register a fresh test_module built from _SAMPLE_CODE in sys.modules."""
+    module = ModuleType("test_module")
+    exec(_SAMPLE_CODE, module.__dict__)
+    mp.setitem(sys.modules, "test_module", module)
+    return module
 
-    return test_module
 
+@pytest.fixture
+def sample_module(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Sample module, removed from sys.modules at teardown."""
+    return _install_sample_module(monkeypatch)
 
-class TestCodeAnalyzer:
-    """Test CodeAnalyzer."""
 
-    def test_get_public_apis(self, sample_module: ModuleType, tmp_path: Path):
-        analyzer = CodeAnalyzer(tmp_path)
-        apis = analyzer.get_public_apis("test_module")
+@pytest.fixture(scope="module")
+def sample_apis(tmp_path_factory: pytest.TempPathFactory) -> list[SignatureInfo]:
+    """get_public_apis("test_module") computed once for the read-only tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        _install_sample_module(mp)
+        root = tmp_path_factory.getbasetemp()
+        return CodeAnalyzer(root).get_public_apis("test_module")
 
-        assert len(apis) == 2
-        names = {api.name for api in apis}
-        assert "PublicClass" in names
-        assert "public_function" in names
 
-    def test_class_signature_extraction(self, sample_module: ModuleType, tmp_path: Path):
-        analyzer = CodeAnalyzer(tmp_path)
-        apis = analyzer.get_public_apis("test_module")
+class TestCodeAnalyzer:
+    """Test CodeAnalyzer."""
 
-        class_api = next(api for api in apis if api.name == "PublicClass")
+    def test_get_public_apis(self, sample_apis: list[SignatureInfo]):
+        assert len(sample_apis) == 2
+        assert {api.name for api in sample_apis} == _EXPECTED_TEST_MODULE
+
+    def test_class_signature_extraction(self, sample_apis: list[SignatureInfo]):
+        class_api = next(api for api in sample_apis if api.name == "PublicClass")
         assert class_api.kind == "class"
         assert class_api.is_public is True
         assert len(class_api.parameters) == 2
@@ -85,24 +139,16 @@ class TestCodeAnalyzer:
         assert "int" in class_api.parameters[0]
         assert class_api.docstring == "A public class."
 
-    def test_function_signature_extraction(
-        self, sample_module: ModuleType, tmp_path: Path
-    ):
-        analyzer = CodeAnalyzer(tmp_path)
-        apis = analyzer.get_public_apis("test_module")
-
-        func_api = next(api for api in apis if api.name == "public_function")
+    def test_function_signature_extraction(self, sample_apis: list[SignatureInfo]):
+        func_api = next(api for api in sample_apis if api.name == "public_function")
         assert func_api.kind == "function"
         assert func_api.is_public is True
         assert len(func_api.parameters) == 2
         assert "int" in func_api.return_annotation
         assert func_api.docstring == "A public function."
 
-    def test_parameter_formatting(self, sample_module: ModuleType, tmp_path: Path):
-        analyzer = CodeAnalyzer(tmp_path)
-        apis = analyzer.get_public_apis("test_module")
-
-        func_api = next(api for api in apis if api.name == "public_function")
+    def test_parameter_formatting(self, sample_apis: list[SignatureInfo]):
+        func_api = next(api for api in sample_apis if api.name == "public_function")
         params = func_api.parameters
 
         # Check param with type
@@ -110,181 +156,121 @@ class TestCodeAnalyzer:
         # Check param with default
         assert any("y" in p and "=" in p and "10" in p for p in params)
 
-    def test_nonexistent_module(self, tmp_path: Path):
-        analyzer = CodeAnalyzer(tmp_path)
+    def test_nonexistent_module(self, analyzer: CodeAnalyzer):
         apis = analyzer.get_public_apis("nonexistent_module")
 
         assert apis == []
 
-    def test_get_all_public_apis_with_submodules(self, tmp_path: Path):
-        """Test recursive submodule discovery."""
-        pkg = tmp_path / "nested_pkg"
-        pkg.mkdir()
-        (pkg / "__init__.py").write_text('__all__ = ["TopFunc"]\ndef TopFunc(): "top"\n')
-
-        sub = pkg / "sub"
-        sub.mkdir()
-        (sub / "__init__.py").write_text('__all__ = ["SubFunc"]\ndef SubFunc(): "sub"\n')
-
-        sys.path.insert(0, str(tmp_path))
-        try:
-            analyzer = CodeAnalyzer(tmp_path)
-            apis, _ = analyzer.get_all_public_apis("nested_pkg")
-            names = {api.name for api in apis}
-            assert "TopFunc" in names
-            assert "SubFunc" in names
-            assert len(names) >= 2
-        finally:
-            sys.modules.pop("nested_pkg", None)
-            sys.modules.pop("nested_pkg.sub", None)
-
-    def test_get_all_public_apis_ignore_submodules(self, tmp_path: Path):
-        """Test ignore_submodules skips matching submodules."""
-        pkg = tmp_path / "ign_pkg"
-        pkg.mkdir()
-        (pkg / "__init__.py").write_text('__all__ = ["Top"]\ndef Top(): "top"\n')
-        sub = pkg / "skip_me"
-        sub.mkdir()
-        (sub / "__init__.py").write_text('__all__ = ["Skipped"]\ndef Skipped(): "skip"\n')
-        keep = pkg / "keep"
-        keep.mkdir()
-        (keep / "__init__.py").write_text('__all__ = ["Kept"]\ndef Kept(): "keep"\n')
-
-        sys.path.insert(0, str(tmp_path))
-        try:
-            analyzer = CodeAnalyzer(tmp_path)
-            apis, _ = analyzer.get_all_public_apis(
+    @pytest.mark.parametrize(
+        ("root", "ignore", "expected", "expected_unmatched"),
+        [
+            pytest.param(
+                "nested_pkg",
+                None,
+                frozenset({("nested_pkg", "TopFunc"), ("nested_pkg.sub", "SubFunc")}),
+                frozenset(),
+                id="with_submodules",
+            ),
+            pytest.param(
                 "ign_pkg",
-                ignore_submodules={"ign_pkg.skip_me"},
-            )
-            names = {api.name for api in apis}
-            assert "Top" in names
-            assert "Kept" in names
-            assert "Skipped" not in names
-        finally:
-            sys.modules.pop("ign_pkg", None)
-            sys.modules.pop("ign_pkg.skip_me", None)
-            sys.modules.pop("ign_pkg.keep", None)
-
-    def test_get_all_public_apis_ignore_nonexistent_warns(self, tmp_path: Path):
-        """Warn when ignore_submodules entry matches nothing."""
-        pkg = tmp_path / "warn_pkg"
-        pkg.mkdir()
-        (pkg / "__init__.py").write_text('__all__ = ["W"]\ndef W(): "w"\n')
-        # Need a real subpackage so the warning logic runs
-        sub = pkg / "real_sub"
-        sub.mkdir()
-        (sub / "__init__.py").write_text("__all__ = []\n")
-
-        sys.path.insert(0, str(tmp_path))
-        try:
-            analyzer = CodeAnalyzer(tmp_path)
-            _, unmatched = analyzer.get_all_public_apis(
+                {"ign_pkg.skip_me"},
+                frozenset({("ign_pkg", "Top"), ("ign_pkg.keep", "Kept")}),
+                frozenset(),
+                id="ignore_submodules",
+            ),
+            pytest.param(
                 "warn_pkg",
-                ignore_submodules={"warn_pkg.nonexistent"},
-            )
-            assert "warn_pkg.nonexistent" in unmatched
-        finally:
-            sys.modules.pop("warn_pkg", None)
-            sys.modules.pop("warn_pkg.real_sub", None)
-
-    def test_get_all_public_apis_ignore_no_warn_other_module(self, tmp_path: Path):
-        """No warning when ignore entry targets a different module."""
-        pkg = tmp_path / "other_pkg"
-        pkg.mkdir()
-        (pkg / "__init__.py").write_text('__all__ = ["F"]\ndef F(): "f"\n')
-
-        sys.path.insert(0, str(tmp_path))
-        try:
-            analyzer = CodeAnalyzer(tmp_path)
-            _, unmatched = analyzer.get_all_public_apis(
+                {"warn_pkg.nonexistent"},
+                frozenset({("warn_pkg", "W")}),
+                frozenset({"warn_pkg.nonexistent"}),
+                id="ignore_nonexistent_warns",
+            ),
+            pytest.param(
                 "other_pkg",
-                ignore_submodules={"different_pkg.sub"},
-            )
-            assert len(unmatched) == 0
-        finally:
-            sys.modules.pop("other_pkg", None)
-
-    def test_get_all_public_apis_skips_py_files(self, tmp_path: Path):
-        """Internal .py files are not treated as submodules."""
-        pkg = tmp_path / "flat_pkg"
-        pkg.mkdir()
-        (pkg / "__init__.py").write_text(
-            '__all__ = ["Public"]\n' "from .internal import Internal as Public\n"
-        )
-        # .py file with its own classes — should NOT be discovered
-        (pkg / "internal.py").write_text('class Internal:\n    "impl detail"\n')
-
-        sys.path.insert(0, str(tmp_path))
-        try:
-            analyzer = CodeAnalyzer(tmp_path)
-            apis, _ = analyzer.get_all_public_apis("flat_pkg")
-            names = {(api.module, api.name) for api in apis}
-            # Only top-level export, not internal.py's class
-            assert ("flat_pkg", "Public") in names
-            assert not any(m == "flat_pkg.internal" for m, _ in names)
-        finally:
-            sys.modules.pop("flat_pkg", None)
-            sys.modules.pop("flat_pkg.internal", None)
+                {"different_pkg.sub"},
+                frozenset({("other_pkg", "F")}),
+                frozenset(),
+                id="ignore_no_warn_other_module",
+            ),
+            # Internal .py files are not treated as submodules
+            pytest.param(
+                "flat_pkg",
+                None,
+                frozenset({("flat_pkg", "Public")}),
+                frozenset(),
+                id="skips_py_files",
+            ),
+            # Submodule import error doesn't crash, parent still works
+            pytest.param(
+                "partial_pkg",
+                None,
+                frozenset({("partial_pkg", "Top")}),
+                frozenset(),
+                id="submodule_import_error",
+            ),
+        ],
+    )
+    def test_get_all_public_apis(
+        self,
+        pkg_zip: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        analyzer: CodeAnalyzer,
+        root: str,
+        ignore: set[str] | None,
+        expected: frozenset[tuple[str, str]],
+        expected_unmatched: frozenset[str],
+    ):
+        """Recursive discovery over the shared mini-package archive."""
+        monkeypatch.syspath_prepend(pkg_zip)
+        apis, unmatched = analyzer.get_all_public_apis(root, ignore_submodules=ignore)
+        assert {(api.module, api.name) for api in apis} == expected
+        assert unmatched == expected_unmatched
 
     def test_get_all_public_apis_flat_module(
-        self, sample_module: ModuleType, tmp_path: Path
+        self, sample_module: ModuleType, analyzer: CodeAnalyzer
     ):
         """Flat module: get_all_public_apis == get_public_apis."""
-        analyzer = CodeAnalyzer(tmp_path)
         flat = analyzer.get_public_apis("test_module")
         recursive, _ = analyzer.get_all_public_apis("test_module")
-        assert {a.name for a in flat} == {a.name for a in recursive}
+        assert {a.name for a in flat} == _EXPECTED_TEST_MODULE
+        assert {a.name for a in recursive} == _EXPECTED_TEST_MODULE
 
-    def test_get_all_public_apis_nonexistent(self, tmp_path: Path):
-        analyzer = CodeAnalyzer(tmp_path)
+    def test_get_all_public_apis_nonexistent(self, analyzer: CodeAnalyzer):
         apis, unmatched = analyzer.get_all_public_apis("nonexistent_module_xyz")
         assert apis == []
         assert unmatched == set()
 
-    def test_module_without_all(self, tmp_path: Path):
+    def test_module_without_all(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, analyzer: CodeAnalyzer
+    ):
         """Test module without __all__ attribute."""
         module_dir = tmp_path / "test_module_no_all"
         module_dir.mkdir()
 
         init_file = module_dir / "__init__.py"
-        code = '''
-"""Module without __all__."""
-
-def public_func():
-    """Public function."""
-    pass
+        init_file.write_bytes(_NO_ALL_INIT)
 
-def _private_func():
-    """Private function."""
-    pass
-'''
-        init_file.write_text(code)
-
-        sys.path.insert(0, str(tmp_path))
-        analyzer = CodeAnalyzer(tmp_path)
+        monkeypatch.syspath_prepend(tmp_path)
         apis = analyzer.get_public_apis("test_module_no_all")
 
         # Should include public_func but not _private_func
-        names = {api.name for api in apis}
-        assert "public_func" in names
-        assert "_private_func" not in names
+        assert {api.name for api in apis} == _EXPECTED_NO_ALL
 
-    def test_module_with_syntax_error(self, tmp_path: Path):
+    def test_module_with_syntax_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, analyzer: CodeAnalyzer
+    ):
         """Module with syntax error returns empty list, no crash."""
         module_dir = tmp_path / "syntax_err_mod"
         module_dir.mkdir()
         (module_dir / "__init__.py").write_text("def broken(:\n    pass\n")
 
-        sys.path.insert(0, str(tmp_path))
-        try:
-            analyzer = CodeAnalyzer(tmp_path)
-            apis = analyzer.get_public_apis("syntax_err_mod")
-            assert apis == []
-        finally:
-            sys.modules.pop("syntax_err_mod", None)
+        monkeypatch.syspath_prepend(tmp_path)
+        apis = analyzer.get_public_apis("syntax_err_mod")
+        assert apis == []
 
-    def test_module_with_import_error(self, tmp_path: Path):
+    def test_module_with_import_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, analyzer: CodeAnalyzer
+    ):
         """Module with missing dependency returns empty list, no crash."""
         module_dir = tmp_path / "import_err_mod"
         module_dir.mkdir()
@@ -294,30 +280,6 @@ def _private_func():
             "class Foo: pass\n"
         )
 
-        sys.path.insert(0, str(tmp_path))
-        try:
-            analyzer = CodeAnalyzer(tmp_path)
-            apis = analyzer.get_public_apis("import_err_mod")
-            assert apis == []
-        finally:
-            sys.modules.pop("import_err_mod", None)
-
-    def test_get_all_public_apis_submodule_import_error(self, tmp_path: Path):
-        """Submodule import error doesn't crash, parent still works."""
-        pkg = tmp_path / "partial_pkg"
-        pkg.mkdir()
-        (pkg / "__init__.py").write_text('__all__ = ["Top"]\nclass Top: pass\n')
-        bad_sub = pkg / "bad_sub"
-        bad_sub.mkdir()
-        (bad_sub / "__init__.py").write_text("import nonexistent_dep\n")
-
-        sys.path.insert(0, str(tmp_path))
-        try:
-            analyzer = CodeAnalyzer(tmp_path)
-            apis, _ = analyzer.get_all_public_apis("partial_pkg")
-            names = {api.name for api in apis}
-            # Top-level should still be discovered
-            assert "Top" in names
-        finally:
-            sys.modules.pop("partial_pkg", None)
-            sys.modules.pop("partial_pkg.bad_sub", None)
+        monkeypatch.syspath_prepend(tmp_path)
+        apis = analyzer.get_public_apis("import_err_mod")
+        assert apis == []
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-import sys
+import copy
+import dataclasses
+import hashlib
+import os
+import shutil
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -11,17 +16,14 @@ import pytest
 from doc_checker.checkers import DriftDetector
 from doc_checker.cli import main
 from doc_checker.formatters import format_report
-from doc_checker.models import DriftReport
+from doc_checker.models import DriftReport, QualityIssue
 
+from .helpers import materialize, purge_modules
 
-@pytest.fixture
-def integration_project(tmp_path: Path) -> Path:
-    """Create realistic test project."""
-    # Create module
-    module_dir = tmp_path / "my_lib"
-    module_dir.mkdir()
+pytestmark = pytest.mark.slow
 
-    init_code = '''
+# Project sources, written once per session by integration_project
+_MY_LIB_INIT = '''
 """My Library - Example quantum computing utilities."""
 
 __version__ = "0.1.0"
@@ -86,15 +88,8 @@ def run_simulation(config: dict) -> QuantumState:
     """
     pass
 '''
-    (module_dir / "__init__.py").write_text(init_code)
-
-    # Create docs
-    docs_dir = tmp_path / "docs"
-    docs_dir.mkdir()
 
-    index_md = docs_dir / "index.md"
-    index_md.write_text(
-        """
+_INDEX_MD = """
 # My Library Documentation
 
 Welcome to My Library!
@@ -106,36 +101,136 @@ Welcome to My Library!
 [External Link](https://example.com)
 [Local Link](api.md)
 """
-    )
 
-    api_md = docs_dir / "api.md"
-    api_md.write_text(
-        """
+_API_MD = """
 # API Reference
 
 ::: my_lib.QuantumState
 """
-    )
 
-    # Create mkdocs.yml
-    mkdocs_yml = tmp_path / "mkdocs.yml"
-    mkdocs_yml.write_text(
-        """
+_MKDOCS_YML = """
 site_name: My Library
 nav:
   - Home: index.md
   - API: api.md
 """
-    )
 
-    sys.path.insert(0, str(tmp_path))
-    return tmp_path
+_INTEGRATION_TREE = {
+    "my_lib/__init__.py": _MY_LIB_INIT,
+    "docs/index.md": _INDEX_MD,
+    "docs/api.md": _API_MD,
+    "mkdocs.yml": _MKDOCS_YML,
+}
+
+
+def _shared_tree(
+    tmp_path_factory: pytest.TempPathFactory, name: str, tree: dict[str, str]
+) -> Path:
+    """Materialize `tree` once per content hash, shared by all xdist workers.
+
+    Workers build into their own temp dir and rename it into place; a worker
+    that loses the race discards its copy. The result must be treated as
+    read-only. Without xdist this is a plain per-session directory.
+    """
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        return materialize(tmp_path_factory.mktemp(name), tree)
+
+    digest = hashlib.blake2b(digest_size=8)
+    for rel, content in sorted(tree.items()):
+        digest.update(f"{rel}\0{content}\0".encode())
+    # Worker basetemps (popen-gwN) share the run's pytest-N parent
+    root = tmp_path_factory.getbasetemp().parent / f"{name}-{digest.hexdigest()}"
+    if not root.exists():
+        staging = materialize(tmp_path_factory.mktemp(f"{name}-build"), tree)
+        try:
+            staging.rename(root)
+        except OSError:
+            if not root.is_dir():
+                raise
+    return root
+
+
+@pytest.fixture(scope="session")
+def integration_project(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Create realistic test project, once per session; treat as read-only."""
+    root = _shared_tree(tmp_path_factory, "integration", _INTEGRATION_TREE)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.syspath_prepend(root)
+        yield root
+
+
+@pytest.fixture
+def integration_project_mut(
+    integration_project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Private copy of the integration project for tests that edit it."""
+    project = tmp_path / "proj"
+    shutil.copytree(integration_project, project)
+    # Shadow the shared project on sys.path and re-import my_lib from the copy
+    monkeypatch.syspath_prepend(project)
+    purge_modules("my_lib")
+    return project
+
+
+@pytest.fixture(scope="session")
+def drift_reports(integration_project: Path) -> Callable[..., DriftReport]:
+    """Memoized check_all() on the unmodified integration project.
+
+    Each distinct flag combination runs once per session; callers get a deep
+    copy so mutating a report cannot poison the cache.
+    """
+    cache: dict[tuple[bool, bool, bool, bool], DriftReport] = {}
+
+    def get_report(
+        check_external_links: bool = False,
+        check_quality: bool = False,
+        skip_basic_checks: bool = False,
+        ignore_pulser_reexports: bool = True,
+    ) -> DriftReport:
+        key = (
+            check_external_links,
+            check_quality,
+            skip_basic_checks,
+            ignore_pulser_reexports,
+        )
+        if key not in cache:
+            detector = DriftDetector(
+                integration_project,
+                modules=["my_lib"],
+                ignore_pulser_reexports=ignore_pulser_reexports,
+            )
+            with patch("doc_checker.llm_checker.QualityChecker") as mock_cls:
+                mock_cls.return_value.check_module_quality.return_value = []
+                cache[key] = detector.check_all(
+                    check_external_links=check_external_links,
+                    check_quality=check_quality,
+                    skip_basic_checks=skip_basic_checks,
+                )
+        return copy.deepcopy(cache[key])
+
+    return get_report
+
+
+@pytest.fixture(scope="session")
+def multi_module_project(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Two single-function modules, both documented in docs/index.md."""
+    tree = {
+        f"{mod_name}/__init__.py": (
+            f'"""Module {mod_name}."""\n__all__ = ["func"]\ndef func(): pass'
+        )
+        for mod_name in ("mod_a", "mod_b")
+    }
+    tree["docs/index.md"] = "::: mod_a.func\n::: mod_b.func"
+    tree["mkdocs.yml"] = "nav:\n  - Home: index.md\n"
+    root = _shared_tree(tmp_path_factory, "multi_module", tree)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.syspath_prepend(root)
+        yield root
 
 
-def test_integration_full_report(integration_project: Path):
+def test_integration_full_report(drift_reports: Callable[..., DriftReport]):
     """Test full drift detection report."""
-    detector = DriftDetector(integration_project, modules=["my_lib"])
-    report = detector.check_all()
+    report = drift_reports()
 
     # Should detect no structural issues (all APIs documented)
     assert len(report.missing_in_docs) == 0
@@ -144,10 +239,9 @@ def test_integration_full_report(integration_project: Path):
     assert len(report.broken_mkdocs_paths) == 0
 
 
-def test_integration_report_formatting(integration_project: Path):
+def test_integration_report_formatting(drift_reports: Callable[..., DriftReport]):
     """Test report can be formatted without errors."""
-    detector = DriftDetector(integration_project, modules=["my_lib"])
-    report = detector.check_all()
+    report = drift_reports()
 
     # Format as text
     text_output = format_report(report)
@@ -164,7 +258,7 @@ def test_integration_report_formatting(integration_project: Path):
 
 def test_format_report_external_links_summary():
     """Format report shows external links summary."""
-    report = DriftReport(
+    base = DriftReport(
         total_external_links=10,
         broken_external_links=[
             {
@@ -175,25 +269,24 @@ def test_format_report_external_links_summary():
             },
         ],
     )
-    output = format_report(report)
-    assert "External links: 1/10 broken" in output
+    assert "External links: 1/10 broken" in format_report(base)
 
     # No broken links
-    report_ok = DriftReport(total_external_links=5)
-    output_ok = format_report(report_ok)
-    assert "External links: 0/5 broken" in output_ok
+    ok = dataclasses.replace(base, total_external_links=5, broken_external_links=[])
+    assert "External links: 0/5 broken" in format_report(ok)
 
     # No external check run -> no summary line
-    report_none = DriftReport()
-    output_none = format_report(report_none)
-    assert "External links" not in output_none
+    none = dataclasses.replace(ok, total_external_links=0)
+    assert "External links" not in format_report(none)
 
 
-def test_integration_with_quality_checks_mocked(integration_project: Path):
+def test_integration_with_quality_checks_mocked(
+    integration_project: Path, quality_checker_mock: tuple[MagicMock, MagicMock]
+):
     """Test integration with mocked LLM quality checks."""
-    mock_checker = MagicMock()
+    _, mock_checker = quality_checker_mock
     mock_checker.check_module_quality.return_value = [
-        MagicMock(
+        QualityIssue(
             api_name="my_lib.Simulator.evolve",
             severity="warning",
             category="params",
@@ -201,7 +294,7 @@ def test_integration_with_quality_checks_mocked(integration_project: Path):
             suggestion="Add: 'time (float): Evolution time in nanoseconds'",
             line_reference="time: Evolution time",
         ),
-        MagicMock(
+        QualityIssue(
             api_name="my_lib.run_simulation",
             severity="suggestion",
             category="completeness",
@@ -212,10 +305,7 @@ def test_integration_with_quality_checks_mocked(integration_project: Path):
     ]
 
     detector = DriftDetector(integration_project, modules=["my_lib"])
-
-    with patch("doc_checker.llm_checker.QualityChecker") as mock_checker_class:
-        mock_checker_class.return_value = mock_checker
-        report = detector.check_all(check_quality=True, verbose=False)
+    report = detector.check_all(check_quality=True, verbose=False)
 
     assert len(report.quality_issues) == 2
     assert report.has_issues() is True
@@ -228,20 +318,13 @@ def test_integration_with_quality_checks_mocked(integration_project: Path):
     assert "my_lib.Simulator.evolve" in text_output
 
 
-def test_integration_end_to_end_cli_style(integration_project: Path):
+def test_integration_end_to_end_cli_style(drift_reports: Callable[..., DriftReport]):
     """Test end-to-end workflow similar to CLI usage."""
-    # Simulate CLI workflow
-    detector = DriftDetector(
-        root_path=integration_project,
-        modules=["my_lib"],
-        ignore_pulser_reexports=False,
-    )
-
-    # Run all checks (no external links, no quality)
-    report = detector.check_all(
+    # Simulate CLI workflow: all checks except external links and quality
+    report = drift_reports(
         check_external_links=False,
         check_quality=False,
-        verbose=False,
+        ignore_pulser_reexports=False,
     )
 
     # Verify report structure
@@ -256,20 +339,14 @@ def test_integration_end_to_end_cli_style(integration_project: Path):
     assert "DOCUMENTATION DRIFT REPORT" in output
 
 
-def test_integration_with_broken_docs(integration_project: Path):
+def test_integration_with_broken_docs(integration_project_mut: Path):
     """Test detection of various documentation issues."""
-    # Add broken reference
-    index_md = integration_project / "docs" / "index.md"
-    content = index_md.read_text()
-    content += "\n::: my_lib.NonExistentClass\n"
-    index_md.write_text(content)
-
-    # Add missing local link
-    content += "\n[Broken Link](nonexistent.md)\n"
-    index_md.write_text(content)
+    # Add broken reference and missing local link
+    with (integration_project_mut / "docs" / "index.md").open("a") as f:
+        f.write("\n::: my_lib.NonExistentClass\n\n[Broken Link](nonexistent.md)\n")
 
     # Create undocumented function
-    module_file = integration_project / "my_lib" / "__init__.py"
+    module_file = integration_project_mut / "my_lib" / "__init__.py"
     content = module_file.read_text()
     content += "\n\ndef undocumented_func(x, y): return x + y\n"
     content = content.replace(
@@ -278,7 +355,7 @@ def test_integration_with_broken_docs(integration_project: Path):
     )
     module_file.write_text(content)
 
-    detector = DriftDetector(integration_project, modules=["my_lib"])
+    detector = DriftDetector(integration_project_mut, modules=["my_lib"])
     report = detector.check_all()
 
     # Should detect issues
@@ -289,13 +366,15 @@ def test_integration_with_broken_docs(integration_project: Path):
     assert report.has_issues() is True
 
 
-def test_integration_json_output(integration_project: Path):
+def test_integration_json_output(
+    integration_project: Path, quality_checker_mock: tuple[MagicMock, MagicMock]
+):
     """Test JSON serialization of full report."""
     detector = DriftDetector(integration_project, modules=["my_lib"])
 
-    mock_checker = MagicMock()
+    _, mock_checker = quality_checker_mock
     mock_checker.check_module_quality.return_value = [
-        MagicMock(
+        QualityIssue(
             api_name="test",
             severity="critical",
             category="params",
@@ -304,10 +383,7 @@ def test_integration_json_output(integration_project: Path):
             line_reference=None,
         )
     ]
-
-    with patch("doc_checker.llm_checker.QualityChecker") as mock_checker_class:
-        mock_checker_class.return_value = mock_checker
-        report = detector.check_all(check_quality=True)
+    report = detector.check_all(check_quality=True)
 
     # Convert to dict (JSON-serializable)
     data = report.to_dict()
@@ -326,27 +402,9 @@ def test_integration_json_output(integration_project: Path):
         assert "suggestion" in issue
 
 
-def test_integration_multiple_modules(tmp_path: Path):
+def test_integration_multiple_modules(multi_module_project: Path):
     """Test checking multiple modules."""
-    # Create two modules
-    for mod_name in ["mod_a", "mod_b"]:
-        mod_dir = tmp_path / mod_name
-        mod_dir.mkdir()
-        (mod_dir / "__init__.py").write_text(
-            f'"""Module {mod_name}."""\n__all__ = ["func"]\ndef func(): pass'
-        )
-
-    # Create docs
-    docs_dir = tmp_path / "docs"
-    docs_dir.mkdir()
-    (docs_dir / "index.md").write_text("::: mod_a.func\n::: mod_b.func")
-
-    mkdocs_yml = tmp_path / "mkdocs.yml"
-    mkdocs_yml.write_text("nav:\n  - Home: index.md\n")
-
-    sys.path.insert(0, str(tmp_path))
-
-    detector = DriftDetector(tmp_path, modules=["mod_a", "mod_b"])
+    detector = DriftDetector(multi_module_project, modules=["mod_a", "mod_b"])
     report = detector.check_all()
 
     # Both modules should be checked
@@ -356,15 +414,12 @@ def test_integration_multiple_modules(tmp_path: Path):
 class TestCLIBehavior:
     """Test CLI flag behaviors via DriftDetector."""
 
-    def test_check_basic_runs_only_basic_checks(self, integration_project: Path):
+    def test_check_basic_runs_only_basic_checks(
+        self, drift_reports: Callable[..., DriftReport]
+    ):
         """Test --check-basic runs basic checks, skips external/quality."""
-        detector = DriftDetector(integration_project, modules=["my_lib"])
-
         # Simulate --check-basic: basic checks, no external, no quality
-        report = detector.check_all(
-            check_external_links=False,
-            check_quality=False,
-        )
+        report = drift_reports(check_external_links=False, check_quality=False)
 
         # Basic checks should run (report has structure even if no issues)
         assert hasattr(report, "missing_in_docs")
@@ -377,15 +432,10 @@ class TestCLIBehavior:
         assert len(report.broken_external_links) == 0
         assert len(report.quality_issues) == 0
 
-    def test_check_external_links_only(self, integration_project: Path):
+    def test_check_external_links_only(self, drift_reports: Callable[..., DriftReport]):
         """Test --check-external-links runs only external link checks."""
-        detector = DriftDetector(integration_project, modules=["my_lib"])
-
         # Simulate --check-external-links: skip basic, only external
-        report = detector.check_all(
-            check_external_links=True,
-            skip_basic_checks=True,
-        )
+        report = drift_reports(check_external_links=True, skip_basic_checks=True)
 
         # Basic checks should be empty (skipped)
         assert len(report.missing_in_docs) == 0
@@ -397,20 +447,20 @@ class TestCLIBehavior:
         # Quality should be empty (not enabled)
         assert len(report.quality_issues) == 0
 
-    def test_check_quality_runs_basic_and_quality(self, integration_project: Path):
+    def test_check_quality_runs_basic_and_quality(
+        self,
+        integration_project: Path,
+        quality_checker_mock: tuple[MagicMock, MagicMock],
+    ):
         """Test --check-quality runs basic + quality, no external links."""
         detector = DriftDetector(integration_project, modules=["my_lib"])
+        _, mock_checker = quality_checker_mock
 
-        mock_checker = MagicMock()
-        mock_checker.check_module_quality.return_value = []
-
-        with patch("doc_checker.llm_checker.QualityChecker") as mock_cls:
-            mock_cls.return_value = mock_checker
-            # Simulate --check-quality: basic + quality, no external
-            report = detector.check_all(
-                check_external_links=False,
-                check_quality=True,
-            )
+        # Simulate --check-quality: basic + quality, no external
+        report = detector.check_all(
+            check_external_links=False,
+            check_quality=True,
+        )
 
         # Basic checks ran
         assert hasattr(report, "missing_in_docs")
@@ -422,19 +472,19 @@ class TestCLIBehavior:
         # Quality checker was called
         mock_checker.check_module_quality.assert_called()
 
-    def test_check_all_runs_everything(self, integration_project: Path):
+    def test_check_all_runs_everything(
+        self,
+        integration_project: Path,
+        quality_checker_mock: tuple[MagicMock, MagicMock],
+    ):
         """Test --check-all (default) runs all checks."""
         detector = DriftDetector(integration_project, modules=["my_lib"])
+        _, mock_checker = quality_checker_mock
 
-        mock_checker = MagicMock()
-        mock_checker.check_module_quality.return_value = []
-
-        with patch("doc_checker.llm_checker.QualityChecker") as mock_cls:
-            mock_cls.return_value = mock_checker
-            report = detector.check_all(
-                check_external_links=True,
-                check_quality=True,
-            )
+        report = detector.check_all(
+            check_external_links=True,
+            check_quality=True,
+        )
 
         # Basic checks ran (has structure)
         assert hasattr(report, "missing_in_docs")
@@ -443,43 +493,53 @@ class TestCLIBehavior:
         # Quality checker was called
         mock_checker.check_module_quality.assert_called()
 
+    @pytest.mark.parametrize(
+        "option",
+        [
+            pytest.param(["--quality-cache"], id="cache"),
+            pytest.param(["--quality-concurrency", "4"], id="concurrency"),
+        ],
+    )
+    def test_quality_batch_size_rejects_per_api_options(
+        self, option: list[str], capsys: pytest.CaptureFixture[str]
+    ):
+        """Options the batched path cannot honour are rejected, not dropped."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["--check-quality", "--quality-batch-size", "8", *option])
+
+        assert exc_info.value.code == 2
+        assert "--quality-batch-size" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("size", ["0", "-2"])
+    def test_quality_batch_size_must_be_positive(
+        self, size: str, capsys: pytest.CaptureFixture[str]
+    ):
+        """--quality-batch-size below 1 is an argument error."""
+        with pytest.raises(SystemExit):
+            main(["--check-quality", "--quality-batch-size", size])
+
+        assert "at least 1" in capsys.readouterr().err
+
 
 class TestWarnOnly:
     """Test --warn-only flag."""
 
-    def test_warn_only_exits_zero_with_issues(self, integration_project: Path):
-        """--warn-only should exit 0 even when issues exist."""
-        index_md = integration_project / "docs" / "index.md"
-        content = index_md.read_text()
-        content += "\n::: my_lib.NonExistentClass\n"
-        index_md.write_text(content)
-
-        argv = [
-            "doc-checker",
-            "--check-basic",
-            "--warn-only",
-            "--modules",
-            "my_lib",
-            "--root",
-            str(integration_project),
-        ]
-        with patch("sys.argv", argv):
-            assert main() == 0
-
-    def test_without_warn_only_exits_one_with_issues(self, integration_project: Path):
-        """Without --warn-only should exit 1 when issues exist."""
-        index_md = integration_project / "docs" / "index.md"
-        content = index_md.read_text()
-        content += "\n::: my_lib.NonExistentClass\n"
-        index_md.write_text(content)
-
-        argv = [
-            "doc-checker",
-            "--check-basic",
-            "--modules",
-            "my_lib",
-            "--root",
-            str(integration_project),
-        ]
-        with patch("sys.argv", argv):
-            assert main() == 1
+    @pytest.mark.parametrize(
+        ("warn_only", "expected"),
+        [
+            pytest.param(True, 0, id="warn_only_exits_zero"),
+            pytest.param(False, 1, id="without_warn_only_exits_one"),
+        ],
+    )
+    def test_warn_only(
+        self, integration_project_mut: Path, warn_only: bool, expected: int
+    ):
+        """--warn-only exits 0 even when issues exist; otherwise issues exit 1."""
+        with (integration_project_mut / "docs" / "index.md").open("a") as f:
+            f.write("\n::: my_lib.NonExistentClass\n")
+
+        root = str(integration_project_mut)
+        argv = ["--check-basic", "--modules", "my_lib", "--root", root]
+        if warn_only:
+            argv.append("--warn-only")
+        assert main(argv) == expected
@@ -2,25 +2,54 @@
 
 from __future__ import annotations
 
+import itertools
+import threading
+import urllib.error
+from contextlib import nullcontext
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from doc_checker.link_checker import LinkChecker
-from doc_checker.models import ExternalLink
+from doc_checker.models import ExternalLink, LinkCheckResult
 
 try:
-    import aiohttp  # noqa: F401
+    import aiohttp
 
     AIOHTTP_AVAILABLE = True
 except ImportError:
     AIOHTTP_AVAILABLE = False
 
+try:
+    import urllib3
+
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
+
+
+# (status, is_broken) for a server that answers HEAD and GET alike
+_STATUS_CASES = [
+    (200, False),
+    (404, True),
+    (500, True),
+    (501, True),
+    (403, False),
+    (405, False),
+    (429, False),
+]
+
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _urllib_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Route the sync path through urllib so urlopen patches take effect."""
+    monkeypatch.setattr("doc_checker.link_checker._POOL", None)
+
+
+@pytest.fixture(scope="module")
 def sample_links() -> list[ExternalLink]:
-    """Create sample external links."""
+    """Create sample external links (shared; tests must not mutate them)."""
     return [
         ExternalLink(
             url="https://example.com",
@@ -43,16 +72,108 @@ def sample_links() -> list[ExternalLink]:
     ]
 
 
+class _FakeResp:
+    """Minimal aiohttp response: an async context manager with a status."""
+
+    def __init__(self, status: int):
+        self.status = status
+
+    async def __aenter__(self) -> _FakeResp:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+
+class _FakeSession:
+    """aiohttp session stand-in; HEAD returns `status`, GET `get_status`."""
+
+    def __init__(self, status: int, get_status: int | None = None):
+        self.status = status
+        self.get_status = status if get_status is None else get_status
+        self.methods: list[str] = []
+        self.headers: list[object] = []
+
+    def head(self, url: str, **kwargs: object) -> _FakeResp:
+        self.methods.append("HEAD")
+        self.headers.append(kwargs.get("headers"))
+        return _FakeResp(self.status)
+
+    def get(self, url: str, **kwargs: object) -> _FakeResp:
+        self.methods.append("GET")
+        self.headers.append(kwargs.get("headers"))
+        return _FakeResp(self.get_status)
+
+
+class _FakeSem:
+    """No-op stand-in for asyncio.Semaphore."""
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+
 class TestLinkChecker:
     """Test LinkChecker."""
 
-    def test_deduplicate(self, sample_links: list[ExternalLink]):
+    def test_links_to_check_dedups(self, sample_links: list[ExternalLink]):
+        """No skip-listed hosts here: only repeated URLs are dropped."""
         checker = LinkChecker()
-        unique = checker._deduplicate(sample_links)
+        unique = checker._links_to_check(sample_links, False)
 
         assert len(unique) == 2
-        assert unique[0].url == "https://example.com"
-        assert unique[1].url == "https://github.com"
+        assert {link.url for link in unique} == {
+            "https://example.com",
+            "https://github.com",
+        }
+        # The first occurrence of a duplicated URL is the one kept
+        assert {link.line_number for link in unique} == {1, 2}
+
+    def test_links_to_check_dedups_many(self):
+        """10k links over 1k URLs: one entry per URL, first occurrence, in order."""
+        links = [
+            ExternalLink(
+                url=f"https://example.com/{i % 1000}",
+                text=str(i),
+                file_path=Path("big.md"),
+                line_number=i,
+            )
+            for i in range(10_000)
+        ]
+
+        unique = LinkChecker()._links_to_check(links, False)
+
+        assert [link.line_number for link in unique] == list(range(1000))
+
+    def test_links_to_check_skips_and_dedups_in_one_pass(
+        self, sample_links: list[ExternalLink]
+    ):
+        """Each distinct URL is skip-checked once; duplicates never re-parse."""
+        skipped = ExternalLink(
+            url="https://cdn.jsdelivr.net/package",
+            text="CDN",
+            file_path=Path("test.md"),
+            line_number=4,
+        )
+        checker = LinkChecker()
+
+        with patch.object(
+            checker, "_should_skip", wraps=checker._should_skip
+        ) as mock_skip:
+            unique = checker._links_to_check([skipped, *sample_links, skipped], False)
+
+        assert [c.args[0] for c in mock_skip.call_args_list] == [
+            "https://cdn.jsdelivr.net/package",
+            "https://example.com",
+            "https://github.com",
+        ]
+        assert [link.url for link in unique] == [
+            "https://example.com",
+            "https://github.com",
+        ]
+        assert [link.line_number for link in unique] == [1, 2]
 
     def test_should_skip_domain(self):
         checker = LinkChecker()
@@ -61,79 +182,102 @@ class TestLinkChecker:
         assert checker._should_skip("https://cdn.jsdelivr.net/package", False)
         assert not checker._should_skip("https://example.com", False)
 
-    @pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not available")
-    @pytest.mark.asyncio
-    async def test_check_one_success(self, sample_links: list[ExternalLink]):
-        """Test successful link check."""
+    def test_should_skip_domain_ignores_port_and_case(self):
         checker = LinkChecker()
 
-        # Mock aiohttp session
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.__aenter__.return_value = mock_response
-        mock_response.__aexit__.return_value = None
-
-        mock_session = MagicMock()
-        mock_session.head.return_value = mock_response
+        assert checker._should_skip("https://CDN.jsdelivr.net:443/package", False)
+        assert checker._should_skip("https://user@cdn.jsdelivr.net/package", False)
+        assert not checker._should_skip("https://jsdelivr.net/package", False)
 
-        semaphore = AsyncMock()
-        semaphore.__aenter__.return_value = None
-        semaphore.__aexit__.return_value = None
+    @pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not available")
+    @pytest.mark.parametrize(
+        ("status", "is_broken"),
+        _STATUS_CASES,
+    )
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_check_one(
+        self, status: int, is_broken: bool, sample_links: list[ExternalLink]
+    ):
+        """Status maps to is_broken; 403/405/429 are acceptable."""
+        checker = LinkChecker()
+        session = _FakeSession(status)
 
-        result = await checker._check_one(mock_session, sample_links[0], semaphore, False)
+        result = await checker._check_one(session, sample_links[0], _FakeSem(), False)
 
-        assert result.is_broken is False
-        assert result.status_code == 200
-        assert result.error is None
+        assert result.is_broken is is_broken
+        assert result.status_code == status
+        if not is_broken:
+            assert result.error is None
 
     @pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not available")
-    @pytest.mark.asyncio
-    async def test_check_one_not_found(self, sample_links: list[ExternalLink]):
-        """Test 404 link check."""
+    @pytest.mark.parametrize(
+        ("head_status", "get_status", "methods", "is_broken"),
+        [
+            (405, 200, ["HEAD", "GET"], False),
+            (501, 404, ["HEAD", "GET"], True),
+            (404, 200, ["HEAD"], True),
+        ],
+    )
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_check_one_head_fallback_to_get(
+        self,
+        sample_links: list[ExternalLink],
+        head_status: int,
+        get_status: int,
+        methods: list[str],
+        is_broken: bool,
+    ):
+        """HEAD 405/501 retries once with GET; other statuses don't."""
         checker = LinkChecker()
+        session = _FakeSession(head_status, get_status)
 
-        mock_response = AsyncMock()
-        mock_response.status = 404
-        mock_response.__aenter__.return_value = mock_response
-        mock_response.__aexit__.return_value = None
+        result = await checker._check_one(session, sample_links[0], _FakeSem(), False)
 
-        mock_session = MagicMock()
-        mock_session.head.return_value = mock_response
+        assert session.methods == methods
+        assert result.is_broken is is_broken
 
-        semaphore = AsyncMock()
-        semaphore.__aenter__.return_value = None
-        semaphore.__aexit__.return_value = None
+    @pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not available")
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_check_one_sends_headers(self, sample_links: list[ExternalLink]):
+        """HEAD and the GET retry both carry the User-Agent and Accept headers."""
+        checker = LinkChecker()
+        session = _FakeSession(405, get_status=200)
 
-        result = await checker._check_one(mock_session, sample_links[0], semaphore, False)
+        await checker._check_one(session, sample_links[0], _FakeSem(), False)
 
-        assert result.is_broken is True
-        assert result.status_code == 404
+        assert session.headers == [LinkChecker.HEADERS, LinkChecker.HEADERS]
+        assert LinkChecker.HEADERS["Accept"].startswith("text/html")
 
     @pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not available")
-    @pytest.mark.asyncio
-    async def test_check_one_acceptable_status(self, sample_links: list[ExternalLink]):
-        """Test acceptable status codes (403, 405, 429)."""
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_check_async_uses_injected_session(
+        self, sample_links: list[ExternalLink]
+    ):
+        """An injected session is used as-is and left open for the caller."""
         checker = LinkChecker()
+        session = _FakeSession(200)
 
-        for status in [403, 429]:
-            mock_response = AsyncMock()
-            mock_response.status = status
-            mock_response.__aenter__.return_value = mock_response
-            mock_response.__aexit__.return_value = None
+        results = await checker._check_async(sample_links, False, session=session)
 
-            mock_session = MagicMock()
-            mock_session.head.return_value = mock_response
+        assert [r.link.url for r in results] == [
+            "https://example.com",
+            "https://github.com",
+        ]
+        assert all(r.status_code == 200 for r in results)
 
-            semaphore = AsyncMock()
-            semaphore.__aenter__.return_value = None
-            semaphore.__aexit__.return_value = None
+    @pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not available")
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_check_async_limits_connections_per_host(self):
+        """Owned sessions cap both total and per-host connections."""
+        checker = LinkChecker(max_concurrent=8, max_per_host=3)
 
-            result = await checker._check_one(
-                mock_session, sample_links[0], semaphore, False
-            )
+        with patch.object(
+            aiohttp, "TCPConnector", wraps=aiohttp.TCPConnector
+        ) as mock_connector:
+            assert await checker._check_async([], False) == []
 
-            assert result.is_broken is False
-            assert result.status_code == status
+        kwargs = mock_connector.call_args.kwargs
+        assert (kwargs["limit"], kwargs["limit_per_host"]) == (8, 3)
 
     def test_check_links_sync_fallback(self, sample_links: list[ExternalLink]):
         """Test sync fallback when aiohttp unavailable."""
@@ -143,27 +287,89 @@ class TestLinkChecker:
         with patch("urllib.request.urlopen") as mock_urlopen:
             mock_response = MagicMock()
             mock_response.getcode.return_value = 200
-            mock_urlopen.return_value.__enter__.return_value = mock_response
+            mock_urlopen.side_effect = itertools.repeat(nullcontext(mock_response))
 
             results = checker._check_sync(sample_links[:1], False)
 
             assert len(results) == 1
             assert results[0].is_broken is False
             assert results[0].status_code == 200
+            request = mock_urlopen.call_args.args[0]
+            assert request.get_header("Accept") == LinkChecker.HEADERS["Accept"]
 
-    def test_check_links_filters_duplicates(self, sample_links: list[ExternalLink]):
-        """Test that check_links deduplicates."""
+    def test_check_sync_head_405_falls_back_to_get(
+        self, sample_links: list[ExternalLink]
+    ):
+        """urllib path retries with GET when HEAD is rejected with 405."""
         checker = LinkChecker()
+        ok = MagicMock()
+        ok.__enter__.return_value.getcode.return_value = 200
 
         with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_response = MagicMock()
-            mock_response.getcode.return_value = 200
-            mock_urlopen.return_value.__enter__.return_value = mock_response
+            mock_urlopen.side_effect = [
+                urllib.error.HTTPError(sample_links[0].url, 405, "Not Allowed", {}, None),
+                ok,
+            ]
+            results = checker._check_sync(sample_links[:1], False)
+
+        assert [c.args[0].get_method() for c in mock_urlopen.call_args_list] == [
+            "HEAD",
+            "GET",
+        ]
+        assert results[0].status_code == 200
+        assert results[0].is_broken is False
 
+    def test_check_links_filters_duplicates(self, sample_links: list[ExternalLink]):
+        """Test that check_links deduplicates."""
+        checker = LinkChecker()
+        ok = LinkCheckResult(
+            link=sample_links[0], status_code=200, error=None, is_broken=False
+        )
+
+        with patch.object(LinkChecker, "_check_single_sync", return_value=ok) as mock_one:
             results = checker._check_sync(sample_links, False)
 
-            # Should only check 2 unique URLs
+            # Should only check 2 unique URLs (in parallel, so in any order)
             assert len(results) == 2
+            assert sorted(c.args[0].url for c in mock_one.call_args_list) == [
+                "https://example.com",
+                "https://github.com",
+            ]
+
+    def test_check_sync_parallel_limit(self):
+        """The sync path runs up to max_concurrent checks at once, in order."""
+        links = [
+            ExternalLink(
+                url=f"https://example.com/{i}",
+                text=str(i),
+                file_path=Path("test.md"),
+                line_number=i,
+            )
+            for i in range(6)
+        ]
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+        pair_started = threading.Barrier(2, timeout=5)
+
+        def check_one(link: ExternalLink) -> LinkCheckResult:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            pair_started.wait()
+            with lock:
+                in_flight -= 1
+            return LinkCheckResult(
+                link=link, status_code=200, error=None, is_broken=False
+            )
+
+        checker = LinkChecker(max_concurrent=2)
+        with patch.object(checker, "_check_single_sync", side_effect=check_one):
+            results = checker._check_sync(links, False)
+
+        assert peak == 2
+        assert [r.link for r in results] == links
 
     def test_empty_link_list(self):
         """Test with empty list."""
@@ -172,6 +378,76 @@ class TestLinkChecker:
         assert results == []
 
 
+@pytest.mark.skipif(not URLLIB3_AVAILABLE, reason="urllib3 not available")
+class TestPooledSyncCheck:
+    """Test the urllib3 keep-alive path of the sync fallback."""
+
+    @pytest.mark.parametrize(("status", "is_broken"), _STATUS_CASES)
+    def test_status(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sample_links: list[ExternalLink],
+        status: int,
+        is_broken: bool,
+    ):
+        pool = MagicMock()
+        pool.request.return_value = MagicMock(status=status, reason="Reason")
+        monkeypatch.setattr("doc_checker.link_checker._POOL", pool)
+
+        results = LinkChecker()._check_sync(sample_links[:1], False)
+
+        assert results[0].status_code == status
+        assert results[0].is_broken is is_broken
+        assert pool.request.call_args_list[0].args == ("HEAD", "https://example.com")
+
+    def test_head_405_falls_back_to_get(
+        self, monkeypatch: pytest.MonkeyPatch, sample_links: list[ExternalLink]
+    ):
+        get_response = MagicMock(status=200)
+        pool = MagicMock()
+        pool.request.side_effect = [MagicMock(status=405), get_response]
+        monkeypatch.setattr("doc_checker.link_checker._POOL", pool)
+
+        results = LinkChecker()._check_sync(sample_links[:1], False)
+
+        assert [c.args[0] for c in pool.request.call_args_list] == ["HEAD", "GET"]
+        assert results[0].status_code == 200
+        assert results[0].is_broken is False
+        get_response.close.assert_called_once_with()
+        get_response.release_conn.assert_called_once_with()
+
+    def test_connection_error(
+        self, monkeypatch: pytest.MonkeyPatch, sample_links: list[ExternalLink]
+    ):
+        pool = MagicMock()
+        pool.request.side_effect = urllib3.exceptions.MaxRetryError(
+            pool, sample_links[0].url, "Connection refused"
+        )
+        monkeypatch.setattr("doc_checker.link_checker._POOL", pool)
+
+        results = LinkChecker()._check_sync(sample_links[:1], False)
+
+        assert results[0].is_broken is True
+        assert results[0].status_code is None
+        assert "Connection refused" in str(results[0].error)
+
+    def test_unexpected_error_is_per_link(
+        self, monkeypatch: pytest.MonkeyPatch, sample_links: list[ExternalLink]
+    ):
+        """A non-urllib3 failure marks only that link broken."""
+        pool = MagicMock()
+        pool.request.side_effect = [
+            ValueError("bad url"),
+            MagicMock(status=200, reason="OK"),
+        ]
+        monkeypatch.setattr("doc_checker.link_checker._POOL", pool)
+
+        results = LinkChecker(max_concurrent=1)._check_sync(sample_links, False)
+
+        assert [r.is_broken for r in results] == [True, False]
+        assert results[0].error == "bad url"
+
+
 class TestCheckLinksPublicAPI:
     """Test check_links() public API entry point."""
 
@@ -226,7 +502,7 @@ class TestCheckLinksPublicAPI:
         with patch("urllib.request.urlopen") as mock_urlopen:
             mock_response = MagicMock()
             mock_response.getcode.return_value = 200
-            mock_urlopen.return_value.__enter__.return_value = mock_response
+            mock_urlopen.side_effect = itertools.repeat(nullcontext(mock_response))
 
             with patch("doc_checker.link_checker.AIOHTTP_AVAILABLE", False):
                 results = checker.check_links([skip_link], verbose=False)
@@ -237,8 +513,6 @@ class TestCheckLinksPublicAPI:
 
     def test_check_links_handles_timeout(self, sample_links: list[ExternalLink]):
         """check_links() handles timeout errors gracefully."""
-        import urllib.error
-
         checker = LinkChecker()
 
         with (
@@ -254,8 +528,6 @@ class TestCheckLinksPublicAPI:
 
     def test_check_links_handles_connection_error(self, sample_links: list[ExternalLink]):
         """check_links() handles connection errors gracefully."""
-        import urllib.error
-
         checker = LinkChecker()
 
         with (
@@ -271,8 +543,6 @@ class TestCheckLinksPublicAPI:
 
     def test_check_links_acceptable_status_403(self, sample_links: list[ExternalLink]):
         """check_links() treats 403 as acceptable (not broken)."""
-        import urllib.error
-
         checker = LinkChecker()
 
         with (
@@ -298,7 +568,7 @@ class TestCheckLinksPublicAPI:
         ):
             mock_response = MagicMock()
             mock_response.getcode.return_value = 200
-            mock_urlopen.return_value.__enter__.return_value = mock_response
+            mock_urlopen.side_effect = itertools.repeat(nullcontext(mock_response))
 
             # sample_links has 3 items, 2 unique URLs
             results = checker.check_links(sample_links, verbose=False)
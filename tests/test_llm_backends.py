@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import importlib.util
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from doc_checker import llm_backends
 from doc_checker.llm_backends import (
     LLMBackend,
     OllamaBackend,
@@ -78,6 +80,19 @@ def test_generate_json_invalid():
     assert result["score"] == 0
 
 
+@pytest.mark.skipif(
+    importlib.util.find_spec("orjson") is None, reason="orjson not installed"
+)
+def test_generate_json_orjson_fastpath():
+    """orjson parses responses when installed; invalid JSON still falls back."""
+    import orjson
+
+    assert llm_backends._json_loads is orjson.loads
+    backend = MockLLMBackend(['```json\n{"key": "value"}\n```', "{broken"])
+    assert backend.generate_json("test") == {"key": "value"}
+    assert backend.generate_json("test")["issues"] == []
+
+
 @pytest.mark.skipif(True, reason="Requires ollama package - tested via integration")
 def test_ollama_backend_init():
     """Test OllamaBackend initialization."""
@@ -157,52 +172,39 @@ def test_openai_backend_missing_package():
             OpenAIBackend(api_key="test-key")
 
 
-@patch("doc_checker.llm_backends.OllamaBackend")
-def test_get_backend_ollama_default(mock_ollama_class):
-    """Test get_backend returns OllamaBackend by default."""
-    mock_backend = MagicMock()
-    mock_ollama_class.return_value = mock_backend
-
-    backend = get_backend()
-
-    assert backend == mock_backend
-    mock_ollama_class.assert_called_once_with("qwen2.5:3b")
-
-
-@patch("doc_checker.llm_backends.OllamaBackend")
-def test_get_backend_ollama_custom_model(mock_ollama_class):
-    """Test get_backend with custom Ollama model."""
-    mock_backend = MagicMock()
-    mock_ollama_class.return_value = mock_backend
-
-    backend = get_backend(backend_type="ollama", model="llama3.2:3b")
-
-    assert backend == mock_backend
-    mock_ollama_class.assert_called_once_with("llama3.2:3b")
-
-
-@patch("doc_checker.llm_backends.OpenAIBackend")
-def test_get_backend_openai(mock_openai_class):
-    """Test get_backend returns OpenAIBackend."""
-    mock_backend = MagicMock()
-    mock_openai_class.return_value = mock_backend
-
-    backend = get_backend(backend_type="openai", api_key="test-key")
-
-    assert backend == mock_backend
-    mock_openai_class.assert_called_once_with("gpt-4o-mini", "test-key")
-
-
-@patch("doc_checker.llm_backends.OpenAIBackend")
-def test_get_backend_openai_custom_model(mock_openai_class):
-    """Test get_backend with custom OpenAI model."""
-    mock_backend = MagicMock()
-    mock_openai_class.return_value = mock_backend
-
-    backend = get_backend(backend_type="openai", model="gpt-4o", api_key="test-key")
-
-    assert backend == mock_backend
-    mock_openai_class.assert_called_once_with("gpt-4o", "test-key")
+@pytest.mark.parametrize(
+    ("backend_class", "kwargs", "expected_args"),
+    [
+        pytest.param("OllamaBackend", {}, ("qwen2.5:3b",), id="ollama_default"),
+        pytest.param(
+            "OllamaBackend",
+            {"backend_type": "ollama", "model": "llama3.2:3b"},
+            ("llama3.2:3b",),
+            id="ollama_custom_model",
+        ),
+        pytest.param(
+            "OpenAIBackend",
+            {"backend_type": "openai", "api_key": "test-key"},
+            ("gpt-4o-mini", "test-key"),
+            id="openai_default",
+        ),
+        pytest.param(
+            "OpenAIBackend",
+            {"backend_type": "openai", "model": "gpt-4o", "api_key": "test-key"},
+            ("gpt-4o", "test-key"),
+            id="openai_custom_model",
+        ),
+    ],
+)
+def test_get_backend(
+    backend_class: str, kwargs: dict[str, str], expected_args: tuple[str, ...]
+):
+    """get_backend builds the requested backend with default or custom model."""
+    with patch(f"doc_checker.llm_backends.{backend_class}") as mock_class:
+        backend = get_backend(**kwargs)
+
+    assert backend is mock_class.return_value
+    mock_class.assert_called_once_with(*expected_args)
 
 
 def test_get_backend_unknown():
@@ -2,71 +2,119 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import asyncio
+import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from doc_checker import llm_checker
+from doc_checker.code_analyzer import CodeAnalyzer
+from doc_checker.llm_backends import LLMBackend
 from doc_checker.llm_checker import QualityChecker
 from doc_checker.models import SignatureInfo
 
-
-@pytest.fixture
-def mock_backend():
-    """Mock LLM backend."""
-    backend = MagicMock()
-    backend.generate_json.return_value = {
-        "issues": [
-            {
-                "severity": "warning",
-                "category": "grammar",
-                "message": "Test issue",
-                "suggestion": "Fix it",
-                "line_reference": "test text",
-            }
-        ],
-        "score": 85,
-        "summary": "Good overall",
-    }
-    return backend
-
-
-@pytest.fixture
-def mock_code_analyzer(tmp_path: Path):
-    """Mock code analyzer."""
-    analyzer = MagicMock()
-    apis = [
-        SignatureInfo(
-            name="test_func",
-            module="test_module",
-            parameters=["x: int", "y: str = 'default'"],
-            return_annotation="bool",
-            docstring="Test function docstring.",
-            is_public=True,
-            kind="function",
-        ),
+_RESPONSE = {
+    "issues": [
+        {
+            "severity": "warning",
+            "category": "grammar",
+            "message": "Test issue",
+            "suggestion": "Fix it",
+            "line_reference": "test text",
+        }
+    ],
+    "score": 85,
+    "summary": "Good overall",
+}
+
+_APIS = [
+    SignatureInfo(
+        name="test_func",
+        module="test_module",
+        parameters=["x: int", "y: str = 'default'"],
+        return_annotation="bool",
+        docstring="Test function docstring.",
+        is_public=True,
+        kind="function",
+    ),
+    SignatureInfo(
+        name="no_docstring_func",
+        module="test_module",
+        parameters=[],
+        return_annotation=None,
+        docstring=None,
+        is_public=True,
+        kind="function",
+    ),
+]
+
+
+def _funcs(count: int, documented: bool = True) -> list[SignatureInfo]:
+    """APIs func_0..func_{count-1} in test_module."""
+    return [
         SignatureInfo(
-            name="no_docstring_func",
+            name=f"func_{i}",
             module="test_module",
             parameters=[],
             return_annotation=None,
-            docstring=None,
+            docstring=f"Function {i}" if documented else None,
             is_public=True,
             kind="function",
-        ),
+        )
+        for i in range(count)
     ]
+
+
+def _set_apis(analyzer: MagicMock, apis: list[SignatureInfo]) -> None:
     analyzer.get_public_apis.return_value = apis
     analyzer.get_all_public_apis.return_value = (apis, set())
+
+
+@pytest.fixture
+def mock_backend():
+    """Mock LLM backend."""
+    backend = MagicMock(spec=LLMBackend)
+    backend.generate_json.return_value = _RESPONSE
+    return backend
+
+
+@pytest.fixture
+def mock_code_analyzer():
+    """Mock code analyzer."""
+    analyzer = MagicMock(spec=CodeAnalyzer)
+    _set_apis(analyzer, _APIS)
     return analyzer
 
 
-@patch("doc_checker.llm_checker.get_backend")
-@patch("doc_checker.llm_checker.CodeAnalyzer")
+@pytest.fixture(scope="module")
+def shared_checker(tmp_path_factory: pytest.TempPathFactory) -> QualityChecker:
+    """One QualityChecker with a mocked backend and analyzer, built per module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(llm_checker, "get_backend", lambda *a: MagicMock(spec=LLMBackend))
+        mp.setattr(llm_checker, "CodeAnalyzer", lambda root: MagicMock(spec=CodeAnalyzer))
+        return QualityChecker(tmp_path_factory.mktemp("quality"))
+
+
+@pytest.fixture
+def quality_checker(shared_checker: QualityChecker) -> QualityChecker:
+    """shared_checker with its mocks reset to _APIS and _RESPONSE."""
+    backend, analyzer = shared_checker.backend, shared_checker.code_analyzer
+    for mock in (backend, analyzer):
+        mock.reset_mock(return_value=True, side_effect=True)
+    backend.generate_json.return_value = _RESPONSE
+    _set_apis(analyzer, _APIS)
+    return shared_checker
+
+
+@patch("doc_checker.llm_checker.get_backend", autospec=True)
+@patch("doc_checker.llm_checker.CodeAnalyzer", autospec=True)
 def test_quality_checker_init(mock_analyzer_class, mock_get_backend, tmp_path):
     """Test QualityChecker initialization."""
-    mock_backend = MagicMock()
+    mock_backend = MagicMock(spec=LLMBackend)
     mock_get_backend.return_value = mock_backend
-    mock_analyzer_class.return_value = MagicMock()
+    mock_analyzer_class.return_value = MagicMock(spec=CodeAnalyzer)
 
     checker = QualityChecker(
         tmp_path, backend_type="ollama", model="qwen2.5:3b", api_key=None
@@ -78,17 +126,9 @@ def test_quality_checker_init(mock_analyzer_class, mock_get_backend, tmp_path):
     mock_analyzer_class.assert_called_once_with(tmp_path)
 
 
-@patch("doc_checker.llm_checker.get_backend")
-@patch("doc_checker.llm_checker.CodeAnalyzer")
-def test_quality_checker_check_api_quality_success(
-    mock_analyzer_class, mock_get_backend, tmp_path, mock_backend, mock_code_analyzer
-):
+def test_quality_checker_check_api_quality_success(quality_checker):
     """Test successful API quality check."""
-    mock_get_backend.return_value = mock_backend
-    mock_analyzer_class.return_value = mock_code_analyzer
-
-    checker = QualityChecker(tmp_path)
-    issues = checker.check_api_quality("test_func", "test_module", verbose=False)
+    issues = quality_checker.check_api_quality("test_func", "test_module", verbose=False)
 
     assert len(issues) == 1
     assert issues[0].api_name == "test_module.test_func"
@@ -99,78 +139,133 @@ def test_quality_checker_check_api_quality_success(
     assert issues[0].line_reference == "test text"
 
 
-@patch("doc_checker.llm_checker.get_backend")
-@patch("doc_checker.llm_checker.CodeAnalyzer")
-def test_quality_checker_api_not_found(
+@patch("doc_checker.llm_checker.get_backend", autospec=True)
+@patch("doc_checker.llm_checker.CodeAnalyzer", autospec=True)
+def test_quality_checker_cache_reuses_results(
     mock_analyzer_class, mock_get_backend, tmp_path, mock_backend, mock_code_analyzer
 ):
-    """Test quality check for non-existent API."""
+    """With use_cache, a re-run with an unchanged docstring skips the LLM."""
     mock_get_backend.return_value = mock_backend
     mock_analyzer_class.return_value = mock_code_analyzer
 
-    checker = QualityChecker(tmp_path)
-    issues = checker.check_api_quality("nonexistent", "test_module")
+    first = QualityChecker(tmp_path, use_cache=True).check_api_quality(
+        "test_func", "test_module"
+    )
+    second = QualityChecker(tmp_path, use_cache=True).check_api_quality(
+        "test_func", "test_module"
+    )
 
-    assert len(issues) == 1
-    assert issues[0].severity == "critical"
-    assert issues[0].category == "error"
-    assert "not found" in issues[0].message
+    assert mock_backend.generate_json.call_count == 1
+    assert second == first
+    (entry,) = (tmp_path / ".doc_checker_cache").glob("*.json")
+    raw = entry.read_bytes()
+    assert b"\n" not in raw
+    assert json.loads(raw)[0]["api_name"] == "test_module.test_func"
 
 
-@patch("doc_checker.llm_checker.get_backend")
-@patch("doc_checker.llm_checker.CodeAnalyzer")
-def test_quality_checker_no_docstring(
+@patch("doc_checker.llm_checker.get_backend", autospec=True)
+@patch("doc_checker.llm_checker.CodeAnalyzer", autospec=True)
+def test_quality_checker_corrupt_cache_is_a_miss(
     mock_analyzer_class, mock_get_backend, tmp_path, mock_backend, mock_code_analyzer
 ):
-    """Test quality check for API without docstring."""
+    """A truncated cache entry is re-checked and replaced, not raised."""
     mock_get_backend.return_value = mock_backend
     mock_analyzer_class.return_value = mock_code_analyzer
 
-    checker = QualityChecker(tmp_path)
-    issues = checker.check_api_quality("no_docstring_func", "test_module")
+    checker = QualityChecker(tmp_path, use_cache=True)
+    first = checker.check_api_quality("test_func", "test_module")
+    (entry,) = (tmp_path / ".doc_checker_cache").glob("*")
+    entry.write_bytes(b'[{"api_na')
 
-    assert len(issues) == 1
-    assert issues[0].severity == "critical"
-    assert issues[0].category == "completeness"
-    assert "No docstring" in issues[0].message
+    assert checker.check_api_quality("test_func", "test_module") == first
+    assert mock_backend.generate_json.call_count == 2
+    assert [p.name for p in entry.parent.iterdir()] == [entry.name]
+    assert json.loads(entry.read_bytes())[0]["api_name"] == "test_module.test_func"
 
 
-@patch("doc_checker.llm_checker.get_backend")
-@patch("doc_checker.llm_checker.CodeAnalyzer")
-def test_quality_checker_llm_failure(
-    mock_analyzer_class, mock_get_backend, tmp_path, mock_code_analyzer
+@patch("doc_checker.llm_checker.get_backend", autospec=True)
+@patch("doc_checker.llm_checker.CodeAnalyzer", autospec=True)
+def test_quality_checker_does_not_cache_parse_failures(
+    mock_analyzer_class, mock_get_backend, tmp_path, mock_backend, mock_code_analyzer
 ):
-    """Test quality check handles LLM failures gracefully."""
-    mock_backend = MagicMock()
-    mock_backend.generate_json.side_effect = Exception("LLM error")
+    """An unparseable response is not cached, so the next run asks again."""
     mock_get_backend.return_value = mock_backend
     mock_analyzer_class.return_value = mock_code_analyzer
+    mock_backend.generate_json.side_effect = [
+        {"error": "Failed to parse JSON", "issues": [], "score": 0},
+        _RESPONSE,
+    ]
 
-    checker = QualityChecker(tmp_path)
-    issues = checker.check_api_quality("test_func", "test_module")
+    checker = QualityChecker(tmp_path, use_cache=True)
+    assert checker.check_api_quality("test_func", "test_module") == []
+    assert not list((tmp_path / ".doc_checker_cache").glob("*"))
 
-    assert len(issues) == 1
-    assert issues[0].severity == "warning"
-    assert issues[0].category == "error"
-    assert "LLM check failed" in issues[0].message
+    issues = checker.check_api_quality("test_func", "test_module")
+    assert [issue.message for issue in issues] == ["Test issue"]
+    assert mock_backend.generate_json.call_count == 2
 
 
-@patch("doc_checker.llm_checker.get_backend")
-@patch("doc_checker.llm_checker.CodeAnalyzer")
-def test_quality_checker_verbose_output(
+@patch("doc_checker.llm_checker.get_backend", autospec=True)
+@patch("doc_checker.llm_checker.CodeAnalyzer", autospec=True)
+def test_quality_checker_cache_write_is_best_effort(
     mock_analyzer_class,
     mock_get_backend,
     tmp_path,
     mock_backend,
     mock_code_analyzer,
-    capsys,
+    monkeypatch,
 ):
-    """Test quality checker verbose output."""
+    """A failing cache write still returns the issues and leaves no temp file."""
     mock_get_backend.return_value = mock_backend
     mock_analyzer_class.return_value = mock_code_analyzer
 
-    checker = QualityChecker(tmp_path)
-    checker.check_api_quality("test_func", "test_module", verbose=True)
+    def read_only(src, dst):
+        raise PermissionError(dst)
+
+    monkeypatch.setattr(llm_checker.os, "replace", read_only)
+    issues = QualityChecker(tmp_path, use_cache=True).check_api_quality(
+        "test_func", "test_module"
+    )
+
+    assert [issue.message for issue in issues] == ["Test issue"]
+    assert not list((tmp_path / ".doc_checker_cache").iterdir())
+
+
+def test_quality_checker_api_not_found(quality_checker):
+    """Test quality check for non-existent API."""
+    issues = quality_checker.check_api_quality("nonexistent", "test_module")
+
+    assert len(issues) == 1
+    assert issues[0].severity == "critical"
+    assert issues[0].category == "error"
+    assert "not found" in issues[0].message
+
+
+def test_quality_checker_no_docstring(quality_checker):
+    """Test quality check for API without docstring."""
+    issues = quality_checker.check_api_quality("no_docstring_func", "test_module")
+
+    assert len(issues) == 1
+    assert issues[0].severity == "critical"
+    assert issues[0].category == "completeness"
+    assert "No docstring" in issues[0].message
+
+
+def test_quality_checker_llm_failure(quality_checker):
+    """Test quality check handles LLM failures gracefully."""
+    quality_checker.backend.generate_json.side_effect = Exception("LLM error")
+
+    issues = quality_checker.check_api_quality("test_func", "test_module")
+
+    assert len(issues) == 1
+    assert issues[0].severity == "warning"
+    assert issues[0].category == "error"
+    assert "LLM check failed" in issues[0].message
+
+
+def test_quality_checker_verbose_output(quality_checker, capsys):
+    """Test quality checker verbose output."""
+    quality_checker.check_api_quality("test_func", "test_module", verbose=True)
 
     captured = capsys.readouterr()
     assert "Checking test_module.test_func" in captured.out
@@ -178,17 +273,9 @@ def test_quality_checker_verbose_output(
     assert "score: 85" in captured.out
 
 
-@patch("doc_checker.llm_checker.get_backend")
-@patch("doc_checker.llm_checker.CodeAnalyzer")
-def test_quality_checker_check_module_quality(
-    mock_analyzer_class, mock_get_backend, tmp_path, mock_backend, mock_code_analyzer
-):
+def test_quality_checker_check_module_quality(quality_checker):
     """Test checking entire module quality."""
-    mock_get_backend.return_value = mock_backend
-    mock_analyzer_class.return_value = mock_code_analyzer
-
-    checker = QualityChecker(tmp_path)
-    issues = checker.check_module_quality("test_module", verbose=False)
+    issues = quality_checker.check_module_quality("test_module", verbose=False)
 
     # Checks both: test_func (LLM issue) and no_docstring_func (no docstring)
     assert len(issues) == 2
@@ -197,48 +284,76 @@ def test_quality_checker_check_module_quality(
     assert "test_module.no_docstring_func" in names
 
 
-@patch("doc_checker.llm_checker.get_backend")
-@patch("doc_checker.llm_checker.CodeAnalyzer")
-def test_quality_checker_sample_rate(
-    mock_analyzer_class, mock_get_backend, tmp_path, mock_backend
-):
-    """Test quality checker sampling."""
-    # Create 10 APIs
-    apis = [
-        SignatureInfo(
-            name=f"func_{i}",
-            module="test_module",
-            parameters=[],
-            return_annotation=None,
-            docstring=f"Function {i}",
-            is_public=True,
-            kind="function",
-        )
-        for i in range(10)
-    ]
+def test_quality_checker_check_module_quality_concurrent(quality_checker):
+    """Concurrent checks overlap LLM calls but keep the serial result order."""
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    both_started = threading.Barrier(2, timeout=5)
 
-    mock_analyzer = MagicMock()
-    mock_analyzer.get_public_apis.return_value = apis
-    mock_analyzer.get_all_public_apis.return_value = (apis, set())
-    mock_analyzer_class.return_value = mock_analyzer
-    mock_get_backend.return_value = mock_backend
+    def slow_generate_json(prompt):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        both_started.wait()
+        with lock:
+            in_flight -= 1
+        return {"issues": [{"severity": "warning", "message": prompt[:10]}]}
+
+    _set_apis(quality_checker.code_analyzer, _funcs(4))
+    quality_checker.backend.generate_json.side_effect = slow_generate_json
+
+    issues = quality_checker.check_module_quality("test_module", max_concurrent=2)
+
+    assert peak == 2
+    assert [i.api_name for i in issues] == [f"test_module.func_{i}" for i in range(4)]
 
-    checker = QualityChecker(tmp_path)
-    issues = checker.check_module_quality("test_module", verbose=False, sample_rate=0.3)
+
+def test_quality_checker_check_module_quality_concurrent_in_event_loop(quality_checker):
+    """max_concurrent works from inside a running event loop (e.g. Jupyter)."""
+    _set_apis(quality_checker.code_analyzer, _funcs(3))
+
+    async def run():
+        return quality_checker.check_module_quality("test_module", max_concurrent=2)
+
+    issues = asyncio.run(run())
+
+    assert [i.api_name for i in issues] == [f"test_module.func_{i}" for i in range(3)]
+
+
+def test_quality_checker_sample_rate(quality_checker):
+    """Test quality checker sampling."""
+    _set_apis(quality_checker.code_analyzer, _funcs(10))
+
+    issues = quality_checker.check_module_quality(
+        "test_module", verbose=False, sample_rate=0.3
+    )
 
     # Should check ~3 APIs (30% of 10)
     # Each API generates 1 issue, so ~3 issues
     assert 1 <= len(issues) <= 5  # Allow some variance due to random sampling
 
 
-@patch("doc_checker.llm_checker.get_backend")
-@patch("doc_checker.llm_checker.CodeAnalyzer")
-def test_quality_checker_multiple_issues(
-    mock_analyzer_class, mock_get_backend, tmp_path, mock_code_analyzer
+@pytest.mark.parametrize(
+    ("sample_rate", "expected_count"), [(0.3, 3), (0.01, 1), (1.0, 10)]
+)
+def test_quality_checker_sample_keeps_api_order(
+    quality_checker, sample_rate, expected_count
 ):
+    """Sampling checks at least one API and preserves the analyzer's order."""
+    _set_apis(quality_checker.code_analyzer, _funcs(10, documented=False))
+
+    issues = quality_checker.check_module_quality("test_module", sample_rate=sample_rate)
+
+    indices = [int(i.api_name.rsplit("_", 1)[1]) for i in issues]
+    assert len(indices) == expected_count
+    assert indices == sorted(indices)
+
+
+def test_quality_checker_multiple_issues(quality_checker):
     """Test quality check with multiple issues."""
-    mock_backend = MagicMock()
-    mock_backend.generate_json.return_value = {
+    quality_checker.backend.generate_json.return_value = {
         "issues": [
             {
                 "severity": "critical",
@@ -265,11 +380,8 @@ def test_quality_checker_multiple_issues(
         "score": 65,
         "summary": "Needs improvement",
     }
-    mock_get_backend.return_value = mock_backend
-    mock_analyzer_class.return_value = mock_code_analyzer
 
-    checker = QualityChecker(tmp_path)
-    issues = checker.check_api_quality("test_func", "test_module")
+    issues = quality_checker.check_api_quality("test_func", "test_module")
 
     assert len(issues) == 3
     assert issues[0].severity == "critical"
@@ -277,41 +389,144 @@ def test_quality_checker_multiple_issues(
     assert issues[2].severity == "suggestion"
 
 
-@patch("doc_checker.llm_checker.get_backend")
-@patch("doc_checker.llm_checker.CodeAnalyzer")
-def test_quality_checker_no_issues(
-    mock_analyzer_class, mock_get_backend, tmp_path, mock_code_analyzer
-):
+def test_quality_checker_max_issues_per_api(quality_checker, monkeypatch):
+    """Only the most severe issues are kept, and the prompt asks for that many."""
+    monkeypatch.setattr(quality_checker, "max_issues_per_api", 2)
+    quality_checker.backend.generate_json.return_value = {
+        "issues": [
+            {"severity": "suggestion", "message": "Add example"},
+            {"severity": "warning", "message": "Typo"},
+            {"severity": "critical", "message": "Missing parameter"},
+            {"severity": "warning", "message": "Unclear"},
+        ]
+    }
+
+    issues = quality_checker.check_api_quality("test_func", "test_module")
+
+    assert [i.message for i in issues] == ["Missing parameter", "Typo"]
+    prompt = quality_checker.backend.generate_json.call_args.args[0]
+    assert "at most 2 issues" in prompt
+
+
+def test_quality_checker_no_issues(quality_checker):
     """Test quality check with perfect documentation."""
-    mock_backend = MagicMock()
-    mock_backend.generate_json.return_value = {
+    quality_checker.backend.generate_json.return_value = {
         "issues": [],
         "score": 100,
         "summary": "Perfect documentation",
     }
-    mock_get_backend.return_value = mock_backend
-    mock_analyzer_class.return_value = mock_code_analyzer
 
-    checker = QualityChecker(tmp_path)
-    issues = checker.check_api_quality("test_func", "test_module")
+    issues = quality_checker.check_api_quality("test_func", "test_module")
 
     assert len(issues) == 0
 
 
-@patch("doc_checker.llm_checker.get_backend")
-@patch("doc_checker.llm_checker.CodeAnalyzer")
-def test_quality_checker_empty_module(
-    mock_analyzer_class, mock_get_backend, tmp_path, mock_backend
-):
+def test_quality_checker_empty_module(quality_checker):
     """Test quality check on module with no APIs."""
-    mock_analyzer = MagicMock()
-    mock_analyzer.get_public_apis.return_value = []
-    mock_analyzer.get_all_public_apis.return_value = ([], set())
-    mock_analyzer_class.return_value = mock_analyzer
-    mock_get_backend.return_value = mock_backend
+    _set_apis(quality_checker.code_analyzer, [])
 
-    checker = QualityChecker(tmp_path)
-    issues = checker.check_module_quality("empty_module")
+    issues = quality_checker.check_module_quality("empty_module")
 
     assert len(issues) == 1
     assert "No public APIs found" in issues[0].message
+
+
+def test_quality_checker_module_quality_batched(quality_checker):
+    """Documented APIs are checked batch_size at a time, one LLM call each."""
+    apis = _funcs(6)
+    apis[0].docstring = None
+    _set_apis(quality_checker.code_analyzer, apis)
+
+    def batch_response(prompt):
+        names = [f"test_module.func_{i}" for i in range(1, 6) if f"func_{i}`" in prompt]
+        return {
+            "apis": [
+                {
+                    "name": name,
+                    "issues": [
+                        {
+                            "severity": "warning",
+                            "category": "grammar",
+                            "message": "Test issue",
+                            "suggestion": "Fix it",
+                        }
+                    ],
+                    "score": 80,
+                }
+                for name in names
+            ]
+        }
+
+    quality_checker.backend.generate_json.side_effect = batch_response
+
+    issues = quality_checker.check_module_quality_batched("test_module", batch_size=2)
+
+    # func_0 has no docstring; func_1..func_5 go out in batches of 2, 2, 1
+    assert quality_checker.backend.generate_json.call_count == 3
+    assert issues[0].api_name == "test_module.func_0"
+    assert issues[0].severity == "critical"
+    assert [i.api_name for i in issues[1:]] == [
+        f"test_module.func_{i}" for i in range(1, 6)
+    ]
+
+
+def test_quality_checker_module_quality_batched_llm_failure(quality_checker):
+    """A failed batch call reports a warning for every API in the batch."""
+    quality_checker.backend.generate_json.side_effect = Exception("LLM error")
+
+    issues = quality_checker.check_module_quality_batched("test_module")
+
+    failed = [i for i in issues if "LLM check failed" in i.message]
+    assert [i.api_name for i in failed] == ["test_module.test_func"]
+    assert all(i.severity == "warning" for i in failed)
+
+
+def test_quality_checker_module_quality_batched_omitted_api(quality_checker):
+    """APIs missing from the response get an error issue; unknown names are dropped."""
+    _set_apis(quality_checker.code_analyzer, _funcs(2))
+    quality_checker.backend.generate_json.return_value = {
+        "apis": [
+            {"name": "test_module.func_1", "issues": _RESPONSE["issues"]},
+            {"name": "test_module.invented", "issues": _RESPONSE["issues"]},
+        ]
+    }
+
+    issues = quality_checker.check_module_quality_batched("test_module")
+
+    assert [(i.api_name, i.category) for i in issues] == [
+        ("test_module.func_0", "error"),
+        ("test_module.func_1", "grammar"),
+    ]
+    assert "no entry" in issues[0].message
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        pytest.param(
+            {"error": "Failed to parse JSON", "issues": [], "score": 0},
+            id="invalid_json",
+        ),
+        pytest.param({"issues": []}, id="no_apis_key"),
+    ],
+)
+def test_quality_checker_module_quality_batched_unusable_response(
+    quality_checker, response
+):
+    """An unusable response reports an error issue for every API in the batch."""
+    _set_apis(quality_checker.code_analyzer, _funcs(2))
+    quality_checker.backend.generate_json.return_value = response
+
+    issues = quality_checker.check_module_quality_batched("test_module")
+
+    assert [i.api_name for i in issues] == ["test_module.func_0", "test_module.func_1"]
+    assert all(i.category == "error" for i in issues)
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_quality_checker_module_quality_batched_rejects_bad_size(
+    quality_checker, batch_size
+):
+    with pytest.raises(ValueError, match="batch_size"):
+        quality_checker.check_module_quality_batched("test_module", batch_size=batch_size)
+    quality_checker.backend.generate_json.assert_not_called()
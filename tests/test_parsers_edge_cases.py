@@ -0,0 +1,109 @@
+"""Tests for parser handling of malformed and unusual docs."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from doc_checker.parsers import MarkdownParser
+
+
+@pytest.fixture
+def md_parser(tmp_docs: Path) -> MarkdownParser:
+    """Parser over this test's tmp_docs; it scans lazily on first find_* call."""
+    return MarkdownParser(tmp_docs)
+
+
+class TestParserEdgeCases:
+    """Test parser error handling for malformed inputs."""
+
+    @pytest.mark.parametrize(
+        ("name", "payload"),
+        [
+            pytest.param("broken.ipynb", b"{invalid json content", id="malformed_json"),
+            pytest.param("no_cells.ipynb", b'{"metadata":{}}', id="missing_cells_key"),
+            pytest.param("empty_cells.ipynb", b'{"cells":[]}', id="empty_cells"),
+            pytest.param(
+                "no_source.ipynb",
+                b'{"cells":[{"cell_type":"code"}]}',
+                id="cell_missing_source",
+            ),
+        ],
+    )
+    def test_broken_notebook_yields_no_links(
+        self, tmp_docs: Path, md_parser: MarkdownParser, name: str, payload: bytes
+    ):
+        """Broken or empty notebooks give no links and don't crash the scan."""
+        (tmp_docs / name).write_bytes(payload)
+
+        assert md_parser.find_external_links() == []
+        assert md_parser.find_local_links() == []
+
+    def test_notebook_cell_source_as_string(
+        self, tmp_docs: Path, md_parser: MarkdownParser
+    ):
+        """Notebook with source as string (not list) still parses."""
+        nb_file = tmp_docs / "string_source.ipynb"
+        nb_file.write_bytes(b'{"cells":[{"source":"[link](https://example.com)"}]}')
+
+        links = md_parser.find_external_links()
+
+        assert len(links) == 1
+        assert links[0].url == "https://example.com"
+
+    def test_markdown_file_read_error(
+        self, tmp_docs: Path, md_parser: MarkdownParser, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Unreadable markdown file returns empty list."""
+        md_file = tmp_docs / "unreadable.md"
+        md_file.write_text("::: my_module.MyClass\n")
+        read_text = Path.read_text
+
+        def fake_read_text(self: Path, *args: Any, **kwargs: Any) -> str:
+            if self == md_file:
+                raise PermissionError(f"Permission denied: '{self}'")
+            return read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", fake_read_text)
+
+        refs = md_parser.find_mkdocstrings_refs()
+
+        # Should gracefully skip unreadable file
+        assert refs == []
+
+    def test_nested_bracket_links(self, tmp_docs: Path, md_parser: MarkdownParser):
+        """Citation-style links like [[2]](url) are extracted."""
+        nb_file = tmp_docs / "citations.ipynb"
+        notebook = {
+            "cells": [
+                {
+                    "source": [
+                        "See [[1]](https://example.com/one)"
+                        " and [[2]](https://arxiv.org/pd/2406.12392)\n",
+                    ]
+                }
+            ],
+        }
+        nb_file.write_text(json.dumps(notebook))
+
+        links = md_parser.find_external_links()
+
+        urls = {link.url for link in links}
+        assert "https://example.com/one" in urls
+        assert "https://arxiv.org/pd/2406.12392" in urls
+        assert len(links) == 2
+
+    def test_single_colon_mkdocstrings_syntax(
+        self, tmp_docs: Path, md_parser: MarkdownParser
+    ):
+        """Single colon mkdocstrings syntax (:: module.Class) is parsed."""
+        md_file = tmp_docs / "single_colon.md"
+        md_file.write_text(":: my_module.MyClass\n")
+
+        refs = md_parser.find_mkdocstrings_refs()
+
+        assert len(refs) == 1
+        assert refs[0].reference == "my_module.MyClass"
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import re
+
+import pytest
+
+from doc_checker import prompts
 from doc_checker.prompts import (
+    get_batch_quality_prompt,
     get_code_alignment_prompt,
     get_combined_quality_prompt,
     get_completeness_prompt,
     get_english_quality_prompt,
 )
 
+# Any example-related keyword, matched case-insensitively without lowering prompts
+_EXAMPLE_KEYWORDS = re.compile(r"example|before/after|concrete", re.IGNORECASE)
+
 
 def test_english_quality_prompt_basic():
     """Test English quality prompt generation."""
@@ -150,79 +159,84 @@ def test_combined_quality_prompt_with_code():
     assert "Code implementation" in prompt
 
 
-def test_all_prompts_request_json():
-    """Test all prompts request JSON format."""
-    sig = "def f() -> None"
-    doc = "Test"
-    api = "module.f"
-
-    prompts = [
-        get_english_quality_prompt(doc, api),
-        get_code_alignment_prompt(sig, doc, api),
-        get_completeness_prompt(sig, doc, api),
-        get_combined_quality_prompt(sig, doc, api),
-    ]
-
-    for prompt in prompts:
-        assert "JSON" in prompt
-        assert "issues" in prompt
-        assert "severity" in prompt
-        assert "score" in prompt
-
+def test_combined_quality_prompt_shared_footer():
+    """Per-API prompts differ only before the shared instructions footer."""
+    with_code = get_combined_quality_prompt("def f()", "F.", "m.f", "    pass")
+    without_code = get_combined_quality_prompt("def g()", "G.", "m.g")
 
-def test_all_prompts_request_examples():
-    """Test all prompts request examples in responses."""
-    sig = "def f() -> None"
-    doc = "Test"
-    api = "module.f"
+    for prompt in (with_code, without_code):
+        assert prompt.endswith(prompts._COMBINED_QUALITY_FOOTER)
+        assert '"issues": [' in prompt
 
-    prompts = [
-        get_english_quality_prompt(doc, api),
-        get_code_alignment_prompt(sig, doc, api),
-        get_completeness_prompt(sig, doc, api),
-        get_combined_quality_prompt(sig, doc, api),
-    ]
 
-    for prompt in prompts:
-        # Check for example-related keywords
-        assert (
-            "example" in prompt.lower()
-            or "before/after" in prompt.lower()
-            or "concrete" in prompt.lower()
-        )
+def test_quality_prompts_issue_limit():
+    """max_issues adds a cap to combined and batch prompts; None leaves none."""
+    entries = [("module.f", "def f()", "F.")]
 
+    assert "at most 3 issues" in get_combined_quality_prompt(
+        "def f()", "F.", "module.f", max_issues=3
+    )
+    assert "at most 3 issues" in get_batch_quality_prompt(entries, max_issues=3)
+    assert "at most" not in get_combined_quality_prompt("def f()", "F.", "module.f")
+    assert "at most" not in get_batch_quality_prompt(entries)
 
-def test_prompts_specify_severity_levels():
-    """Test all prompts specify severity levels."""
-    sig = "def f() -> None"
-    doc = "Test"
-    api = "module.f"
 
-    prompts = [
-        get_english_quality_prompt(doc, api),
-        get_code_alignment_prompt(sig, doc, api),
-        get_completeness_prompt(sig, doc, api),
-        get_combined_quality_prompt(sig, doc, api),
+def test_batch_quality_prompt_lists_every_api():
+    """Batch prompt numbers each API and asks for one JSON entry per API."""
+    entries = [
+        ("module.f", "def f(x: int) -> int", "Doubles x."),
+        ("module.g", "def g() -> None", "Does nothing."),
     ]
 
-    for prompt in prompts:
-        assert "critical" in prompt
-        assert "warning" in prompt
-        assert "suggestion" in prompt
+    prompt = get_batch_quality_prompt(entries)
+
+    for name, signature, docstring in entries:
+        assert name in prompt
+        assert signature in prompt
+        assert docstring in prompt
+    assert prompt.index("module.f") < prompt.index("module.g")
+    assert '"apis"' in prompt
+    assert "JSON" in prompt
 
 
-def test_prompts_include_api_name():
-    """Test all prompts include the API name."""
+@pytest.fixture(scope="module")
+def all_prompts() -> tuple[str, ...]:
+    """Every prompt template rendered once for the same API."""
     sig = "def unique_api_name_12345() -> None"
     doc = "Test docstring"
     api = "module.unique_api_name_12345"
-
-    prompts = [
+    return (
         get_english_quality_prompt(doc, api),
         get_code_alignment_prompt(sig, doc, api),
         get_completeness_prompt(sig, doc, api),
         get_combined_quality_prompt(sig, doc, api),
-    ]
+        get_batch_quality_prompt([(api, sig, doc)]),
+    )
+
+
+@pytest.mark.parametrize(
+    "needle",
+    [
+        # JSON response format
+        "JSON",
+        "issues",
+        "severity",
+        "score",
+        # Severity levels
+        "critical",
+        "warning",
+        "suggestion",
+        # API name
+        "unique_api_name_12345",
+    ],
+)
+def test_all_prompts_contain(all_prompts: tuple[str, ...], needle: str):
+    """Every prompt asks for JSON, names the severity levels and the API."""
+    missing = [i for i, prompt in enumerate(all_prompts) if needle not in prompt]
+    assert missing == []
+
 
-    for prompt in prompts:
-        assert "unique_api_name_12345" in prompt
+def test_all_prompts_request_examples(all_prompts: tuple[str, ...]):
+    """Test all prompts request examples in responses."""
+    for prompt in all_prompts:
+        assert _EXAMPLE_KEYWORDS.search(prompt)